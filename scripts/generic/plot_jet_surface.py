@@ -5,52 +5,112 @@ import os.path
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.colors import to_rgba
+from matplotlib.colors import LightSource, to_rgba
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 
 
 FIG_WIDTH = 9
 FIG_HEIGHT = 6
 
-def plot(save_path=None, file_name="jet-surface.pdf", plot_projection=True,
-         plot_lifts=True, plot_surface=True):
+# File name suffixes keyed by (plot_projection, plot_lifts, plot_surface)
+_VARIANT_SUFFIXES = {
+    (True, True, True): "",
+    (True, True, False): "-no-surface",
+    (True, False, True): "-no-lifts",
+    (True, False, False): "-only-projection",
+    (False, True, True): "-no-projection",
+    (False, True, False): "-only-lifts",
+    (False, False, True): "-only-surface",
+    (False, False, False): "-only-axis",
+}
+
+def _build_figure():
+    """Create the jet surface figure with all artists present.
+
+    The artists of the three plot components are returned so that
+    callers can toggle their visibility without rebuilding the figure.
+    """
+
+    # Let the renderer drop near-collinear points of the smooth curves
+    # instead of submitting every vertex to the backend
+    plt.rc("path", simplify=True, simplify_threshold=0.1)
+    plt.rc("agg.path", chunksize=10000)
 
     xlim = (-1, 1)
     ylim = (-8, 8)
     zlim = (-16, 8)
 
     x_vec = np.linspace(*xlim, 100)
-    #y_vec = np.linspace(*ylim, 100)
-    #xs, ys = np.meshgrid(x_vec, y_vec)
-    # Matplotlib can't render transparent surfaces correctly since it
-    # lacks a 3d-rendering backend. This workaround works for a flat
-    # surface
-    xs, ys = np.meshgrid(xlim, ylim)
-
-    zs = ys
+    exp_x = np.exp(x_vec)
 
     fig, ax = plt.subplots(subplot_kw=dict(projection="3d"),
                            figsize=(FIG_WIDTH, FIG_HEIGHT))
 
-    if plot_surface:
-        ax.plot_surface(xs, ys, zs, antialiased=False,
-                        color=to_rgba("C0", 0.85), edgecolors=to_rgba("C0", 0),
-                        linewidths=0.0)
+    # Depth sorting would ignore the explicit zorders of the
+    # collections and draw the lifted curves behind the translucent
+    # surface, so the draw order is set by zorder alone
+    ax.computed_zorder = False
 
-    for c in np.linspace(-8 * np.exp(1), 8 * np.exp(1), 14)[1:-2]:
-        line_xs = x_vec
-        line_ys = c * np.exp(x_vec)
+    # Matplotlib can't render transparent surfaces correctly since it
+    # lacks a 3d-rendering backend. This workaround works for a flat
+    # surface, which can be drawn as a single unshaded quad instead of
+    # going through the plot_surface pipeline.
+    surface_corners = [[(xlim[0], ylim[0], ylim[0]),
+                        (xlim[1], ylim[0], ylim[0]),
+                        (xlim[1], ylim[1], ylim[1]),
+                        (xlim[0], ylim[1], ylim[1])]]
+
+    # Shade the quad like plot_surface would, so that the surface color
+    # matches the original plot_surface rendering
+    light_source = LightSource(azdeg=225, altdeg=19.4712)
+    normal = np.array((0.0, -1.0, 1.0)) / np.sqrt(2)
+    intensity = 0.3 + 0.7 * (normal @ light_source.direction + 1) / 2
+
+    red, green, blue, alpha = to_rgba("C0", 0.85)
+    surface_color = (intensity * red, intensity * green, intensity * blue,
+                     alpha)
+
+    surface = Poly3DCollection(surface_corners, facecolors=surface_color,
+                               edgecolors=to_rgba("C0", 0), linewidths=0.0,
+                               zorder=2)
+    ax.add_collection3d(surface)
+
+    lift_segments = []
+    projection_segments = []
+
+    c_vec = np.linspace(-8 * np.exp(1), 8 * np.exp(1), 14)[1:-2]
+    # Evaluate all solution curves in a single broadcast pass
+    all_line_ys = c_vec[:, None] * exp_x
+
+    for c, line_ys in zip(c_vec, all_line_ys):
+        # Since exp_x is increasing, the part of the curve inside ylim
+        # is a contiguous slice whose ends can be found by bisection
+        if c > 0:
+            visible = slice(np.searchsorted(exp_x, ylim[0] / c, side="right"),
+                            np.searchsorted(exp_x, ylim[1] / c, side="left"))
+        else:
+            visible = slice(np.searchsorted(exp_x, ylim[1] / c, side="right"),
+                            np.searchsorted(exp_x, ylim[0] / c, side="left"))
+
+        line_xs = x_vec[visible]
+        line_ys = line_ys[visible]
         line_zs = line_ys
 
-        mask = (line_ys > ylim[0]) & (line_ys < ylim[1])
+        lift_segments.append(np.column_stack((line_xs, line_ys, line_zs)))
+        projection_segments.append(np.column_stack((line_xs, line_ys,
+                                                    np.full_like(line_xs,
+                                                                 zlim[0]))))
 
-        line_xs = line_xs[mask]
-        line_ys = line_ys[mask]
-        line_zs = line_zs[mask]
+    # Draw all solution curves as single collections instead of one
+    # artist per curve. The projecting caps match how solid lines are
+    # capped when drawn individually.
+    lifts = Line3DCollection(lift_segments, colors="black",
+                             capstyle="projecting", zorder=4)
+    ax.add_collection3d(lifts)
 
-        if plot_lifts:
-            ax.plot(line_xs, line_ys, line_zs, color="black", zorder=4)
-        if plot_projection:
-            ax.plot(line_xs, line_ys, zlim[0], color="black")
+    projections = Line3DCollection(projection_segments, colors="black",
+                                   capstyle="projecting", zorder=1)
+    ax.add_collection3d(projections)
 
     ax.set_xlim(*xlim)
     ax.set_ylim(*ylim)
@@ -63,41 +123,74 @@ def plot(save_path=None, file_name="jet-surface.pdf", plot_projection=True,
     ax.view_init(elev=12, azim=-68)
     fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
 
+    return fig, ax, surface, lifts, projections
+
+
+def _variant_file_name(file_name, plot_projection, plot_lifts, plot_surface):
+    """Return the file name tagged with the plotted components."""
+
+    name_head, _, name_tail = file_name.partition(".")
+
+    name_head += _VARIANT_SUFFIXES[(plot_projection, plot_lifts,
+                                    plot_surface)]
+
+    return name_head + "." + name_tail
+
+
+def _save_figure(fig, ax, file_path):
+    """Save the figure with a bounding box of the axis that eliminates
+    the vertical white space.
+    """
+
+    bbox = ax.get_position()
+    bbox.x1 += 0.04
+    bbox.y0 = 0.10
+    bbox.y1 = 0.85
+    # Convert the bounding box to inches
+    bbox.x0 *= FIG_WIDTH
+    bbox.x1 *= FIG_WIDTH
+    bbox.y0 *= FIG_HEIGHT
+    bbox.y1 *= FIG_HEIGHT
+
+    fig.savefig(file_path, format="pdf", bbox_inches=bbox)
+
+
+def plot(save_path=None, file_name="jet-surface.pdf", plot_projection=True,
+         plot_lifts=True, plot_surface=True):
+
+    fig, ax, surface, lifts, projections = _build_figure()
+
+    surface.set_visible(plot_surface)
+    lifts.set_visible(plot_lifts)
+    projections.set_visible(plot_projection)
+
     if save_path:
-        name_head, _, name_tail = file_name.partition(".")
-
-        if plot_projection and plot_lifts and not plot_surface:
-            name_head += "-no-surface"
-        if plot_projection and not plot_lifts and plot_surface:
-            name_head += "-no-lifts"
-        if plot_projection and not plot_lifts and not plot_surface:
-            name_head += "-only-projection"
-        if not plot_projection and plot_lifts and plot_surface:
-            name_head += "-no-projection"
-        if not plot_projection and plot_lifts and not plot_surface:
-            name_head += "-only-lifts"
-        if not plot_projection and not plot_lifts and plot_surface:
-            name_head += "-only-surface"
-        if not plot_projection and not plot_lifts and not plot_surface:
-            name_head += "-only-axis"
-
-        file_name = name_head + "." + name_tail
-
-        file_path = os.path.join(save_path, file_name)
-
-        # Create a bounding box of the axis that eliminates the vertical
-        # white space.
-        bbox = ax.get_position()
-        bbox.x1 += 0.04
-        bbox.y0 = 0.10
-        bbox.y1 = 0.85
-        # Convert the bounding box to inches
-        bbox.x0 *= FIG_WIDTH
-        bbox.x1 *= FIG_WIDTH
-        bbox.y0 *= FIG_HEIGHT
-        bbox.y1 *= FIG_HEIGHT
-
-        plt.savefig(file_path, format="pdf", bbox_inches=bbox)
+        file_name = _variant_file_name(file_name, plot_projection, plot_lifts,
+                                       plot_surface)
+
+        _save_figure(fig, ax, os.path.join(save_path, file_name))
+
+
+def plot_all_variants(save_path, file_name="jet-surface.pdf"):
+    """Save all component combinations of the jet surface plot.
+
+    The figure is built once and the component artists are toggled
+    between saves, avoiding a full figure construction per variant.
+    """
+
+    fig, ax, surface, lifts, projections = _build_figure()
+
+    for plot_projection in (True, False):
+        for plot_lifts in (True, False):
+            for plot_surface in (True, False):
+                surface.set_visible(plot_surface)
+                lifts.set_visible(plot_lifts)
+                projections.set_visible(plot_projection)
+
+                variant_name = _variant_file_name(file_name, plot_projection,
+                                                  plot_lifts, plot_surface)
+
+                _save_figure(fig, ax, os.path.join(save_path, variant_name))
 
 
 if __name__ == "__main__":
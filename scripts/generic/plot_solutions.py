@@ -3,6 +3,7 @@ import os.path
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 
 FIG_WIDTH = 9
@@ -11,24 +12,43 @@ FIG_HEIGHT = 6
 
 def plot(save_path=None, file_name="generic-solutions.eps"):
 
+    # Let the renderer drop near-collinear points of the smooth curves
+    # instead of submitting every vertex to the backend
+    plt.rc("path", simplify=True, simplify_threshold=0.1)
+    plt.rc("agg.path", chunksize=10000)
+
     xlim = (-1, 1)
     ylim = (-8, 8)
 
     x_vec = np.linspace(*xlim, 100)
+    exp_x = np.exp(x_vec)
 
     _, ax = plt.subplots(figsize=(FIG_WIDTH, FIG_HEIGHT))
 
-    for c in np.linspace(-8 * np.exp(1), 8 * np.exp(1), 14)[1:-2]:
-        line_xs = x_vec
-        line_ys = c * np.exp(x_vec)
+    line_segments = []
+
+    c_vec = np.linspace(-8 * np.exp(1), 8 * np.exp(1), 14)[1:-2]
+    # Evaluate all solution curves in a single broadcast pass
+    all_line_ys = c_vec[:, None] * exp_x
+
+    for c, line_ys in zip(c_vec, all_line_ys):
+        # Since exp_x is increasing, the part of the curve inside ylim
+        # is a contiguous slice whose ends can be found by bisection
+        if c > 0:
+            visible = slice(np.searchsorted(exp_x, ylim[0] / c, side="right"),
+                            np.searchsorted(exp_x, ylim[1] / c, side="left"))
+        else:
+            visible = slice(np.searchsorted(exp_x, ylim[1] / c, side="right"),
+                            np.searchsorted(exp_x, ylim[0] / c, side="left"))
 
-        mask = (line_ys > ylim[0]) & (line_ys < ylim[1])
+        line_xs = x_vec[visible]
+        line_ys = line_ys[visible]
 
-        line_xs = line_xs[mask]
-        line_ys = line_ys[mask]
+        line_segments.append(np.column_stack((line_xs, line_ys)))
 
-        ax.plot(line_xs, line_ys, color="black", zorder=4)
-        ax.plot(line_xs, line_ys, color="black")
+    # Draw all solution curves as single collections instead of one
+    # artist per curve
+    ax.add_collection(LineCollection(line_segments, colors="black", zorder=4))
 
     ax.set_xlim(*xlim)
     ax.set_ylim(*ylim)
@@ -42,13 +42,20 @@ def plot(save_path=None, file_names=["rotation-field.eps",
     inte_start = (0.3, -0.2)
     angles = np.linspace(0, 2, 30)
 
-    inte_xs = inte_start[0] * np.cos(angles) - inte_start[1] * np.sin(angles)
-    inte_ys = inte_start[0] * np.sin(angles) + inte_start[1] * np.cos(angles)
+    cos_angles = np.cos(angles)
+    sin_angles = np.sin(angles)
+
+    inte_xs = inte_start[0] * cos_angles - inte_start[1] * sin_angles
+    inte_ys = inte_start[0] * sin_angles + inte_start[1] * cos_angles
 
     ax.scatter(*inte_start, marker="o", color="C1", zorder=3)
     ax.scatter(inte_xs[-1], inte_ys[-1], marker="o", color="C1", zorder=3)
-    ax.plot(inte_xs, inte_ys, lw=3,
-            path_effects=[WithArrowStroke(spacing=20.0,scaling=10.0)])
+    inte_line, = ax.plot(inte_xs, inte_ys, lw=3,
+                         path_effects=[WithArrowStroke(spacing=20.0,
+                                                       scaling=10.0)])
+    # Cache the rendered arrow stroke as a raster so that the arrow
+    # path effect is not re-evaluated on every draw
+    inte_line.set_rasterized(True)
 
     if save_path:
         file_path = os.path.join(save_path, file_names[1])
@@ -3,26 +3,45 @@ import os.path
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection, PathCollection
+from matplotlib.markers import MarkerStyle
 from matplotlib.patches import FancyArrowPatch
+from matplotlib.transforms import IdentityTransform
 
 
 def plot(save_path=None, file_name="triangles.pdf", vertex_labels=None):
 
     plt.rc("text", usetex=True)
 
-    triangle1_vertices = np.array([[0, 0], [0.5, np.sqrt(0.75)], [1, 0]])
-    triangle2_vertices = triangle1_vertices + np.array([1.2, 0])
-    triangle3_vertices = triangle2_vertices + np.array([1.2, 0])
+    height = np.sqrt(0.75)
+    offset = np.array([1.2, 0])
 
-    fig, ax = plt.subplots(figsize=(6, 2))
+    triangle_vertices = (np.array([[0, 0], [0.5, height], [1, 0]])
+                         + np.arange(3)[:, None, None] * offset)
+    triangle1_vertices, triangle2_vertices, triangle3_vertices = \
+        triangle_vertices
 
-    tri1 = plt.Polygon(triangle1_vertices, fill=False)
-    tri2 = plt.Polygon(triangle2_vertices, fill=False)
-    tri3 = plt.Polygon(triangle3_vertices, fill=False)
+    fig, ax = plt.subplots(figsize=(6, 2))
 
-    ax.add_patch(tri1)
-    ax.add_patch(tri2)
-    ax.add_patch(tri3)
+    # Fix the axis limits before adding the patches so that each patch
+    # does not trigger an autoscale data-limit update. The limits
+    # contain all markers and arrows with some slack, so that nothing
+    # is clipped at the axis edges.
+    ax.set_autoscale_on(False)
+    ax.set_xlim(-0.3, 3.7)
+    ax.set_ylim(-0.1, 1.0)
+    ax.set_aspect("equal")
+
+    # Reserve the margins that tight_layout would reserve around the
+    # axes
+    fig.subplots_adjust(left=0.025, right=0.975, bottom=0.075, top=0.925)
+
+    # Draw the three triangles as one collection instead of one patch
+    # per triangle
+    triangles = PatchCollection([plt.Polygon(vertices, closed=True)
+                                 for vertices in triangle_vertices],
+                                facecolor="none", edgecolor="black")
+    ax.add_collection(triangles)
 
     points1 = np.stack([triangle1_vertices[0, :],
                         triangle2_vertices[2, :],
@@ -34,12 +53,20 @@ def plot(save_path=None, file_name="triangles.pdf", vertex_labels=None):
                         triangle2_vertices[0, :],
                         triangle3_vertices[2, :]])
 
-    ax.scatter(points1[:, 0], points1[:, 1], marker="o", s=60, color="C0",
-               zorder=3)
-    ax.scatter(points2[:, 0], points2[:, 1], marker="s", s=60, color="C1",
-               zorder=3)
-    ax.scatter(points3[:, 0], points3[:, 1], marker="X", s=60, color="C2",
-               zorder=3)
+    # Draw all vertex markers as a single collection with per-point
+    # marker paths instead of one scatter call per marker style
+    marker_paths = [MarkerStyle(marker).get_path()
+                    .transformed(MarkerStyle(marker).get_transform())
+                    for marker in ("o", "s", "X")]
+
+    markers = PathCollection([path for path in marker_paths for _ in range(3)],
+                             sizes=(60,),
+                             offsets=np.vstack((points1, points2, points3)),
+                             offset_transform=ax.transData,
+                             facecolors=["C0"] * 3 + ["C1"] * 3 + ["C2"] * 3,
+                             zorder=3)
+    markers.set_transform(IdentityTransform())
+    ax.add_collection(markers)
 
     arc2 = FancyArrowPatch(triangle2_vertices[1], triangle2_vertices[0],
                            arrowstyle="->", mutation_scale=10,
@@ -84,12 +111,8 @@ def plot(save_path=None, file_name="triangles.pdf", vertex_labels=None):
             ax.text(*(point + (-0.1, 0.05)), vertex_labels[2],
                     horizontalalignment="right")
 
-    ax.axis("equal")
-    ax.set(xlim=(0, 3.4), ylim=(0, np.sqrt(0.75)))
     ax.axis("off")
 
-    fig.tight_layout()
-
     if save_path:
         file_path = os.path.join(save_path, file_name)
         plt.savefig(file_path, format="pdf",
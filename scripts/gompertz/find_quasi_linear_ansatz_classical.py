@@ -1,7 +1,7 @@
 """Calculate generators linear in the state for the classical Gompertz
 model.
 """
-from sympy import symbols, poly, Function, Eq, exp, dsolve
+from sympy import symbols, Poly, Function, Eq, exp, dsolve
 
 from symmetries import (JetSpace, get_lin_symmetry_cond, Generator,
                         decompose_generator)
@@ -31,7 +31,8 @@ diff_function = Wt - omega
 # Ansatz formulation
 f1, f2, f3, f4 = arbitrary_functions = [Function(f"f_{i}")(t)
                                         for i in range(1, 5)]
-inf_generator = Generator(f1 + f2 * W, f3 + f4 * W, jet_space.base_space)
+inf_generator = Generator(f1 + f2 * W, f3 + f4 * W,
+                          jet_space.original_total_space)
 
 print("Ansatz:")
 print(latex.doprint(Eq(Function(f"\\xi")(t, state), inf_generator.xis[0])))
@@ -49,7 +50,10 @@ num_decomposed_eqs = 0
 print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
       end="", flush=True)
 
-odeqs = poly(lin_symmetry_cond, W).coeffs()
+# Expand once and construct the polynomial directly over the EX
+# domain, skipping the expression rewriting and domain inference that
+# the poly() helper performs
+odeqs = Poly(lin_symmetry_cond.expand(), W, domain="EX").coeffs()
 
 num_decomposed_eqs += 1
 print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
@@ -1,7 +1,9 @@
 """Calculate generators linear in the state for the system Gompertz
 model.
 """
-from sympy import symbols, poly, Function, Eq, dsolve, Derivative, linsolve
+import os
+
+from sympy import symbols, Poly, Function, Eq, dsolve, Derivative, linsolve
 
 from symmetries import (JetSpace, get_lin_symmetry_cond, Generator,
                         decompose_generator)
@@ -11,6 +13,10 @@ from printutils import CustomLatexPrinter
 
 latex = CustomLatexPrinter({"ln_notation": True}, short_functions=False)
 
+# The intermediate equation dumps can be turned off when only the final
+# generators are of interest
+VERBOSE = os.environ.get("GOMPERTZ_VERBOSE", "1") == "1"
+
 # Time
 t = time = symbols("t", real=True)
 # States
@@ -36,7 +42,7 @@ f1, f2, f3, f4, f5, f6, f7, f8, f9 = arbitrary_functions
 inf_generator = Generator(f1 + f2 * W + f3 * G,
                           [f4 + f5 * W + f6 * G,
                            f7 + f8 * W + f9 * G],
-                          jet_space.base_space)
+                          jet_space.original_total_space)
 
 print("Ansatz:")
 print(latex.doprint(Eq(Function(f"\\xi")(t, *states), inf_generator.xis[0])))
@@ -48,9 +54,10 @@ print(latex.doprint(Eq(Function(f"\\eta^2")(t, *states),
 lin_symmetry_cond = get_lin_symmetry_cond(diff_functions, inf_generator,
                                           jet_space, derivative_hints=[Wt, Gt])
 
-print("Linearized symmetry condition:")
-for eq in lin_symmetry_cond:
-    print(latex.doprint(Eq(eq.expand(), 0)))
+if VERBOSE:
+    print("Linearized symmetry condition:")
+    for eq in lin_symmetry_cond:
+        print(latex.doprint(Eq(eq.expand(), 0)))
 
 num_eqs = len(lin_symmetry_cond)
 num_decomposed_eqs = 0
@@ -60,33 +67,60 @@ print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
 
 solvable_eqs = []
 for eq in lin_symmetry_cond:
-    solvable_eqs += poly(eq, states).coeffs()
+    # Expand once and construct the polynomial directly over the EX
+    # domain, skipping the expression rewriting and domain inference
+    # that the poly() helper performs per equation
+    solvable_eqs.extend(Poly(eq.expand(), *states, domain="EX").coeffs())
 
     num_decomposed_eqs += 1
-    print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-          end="", flush=True)
+    # Only print at around twenty evenly spaced points of progress
+    if (num_decomposed_eqs % max(1, num_eqs // 20) == 0
+            or num_decomposed_eqs == num_eqs):
+        print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
+              end="", flush=True)
 
 print(f"\nThe equation system has {str(len(solvable_eqs))} equations",
       flush=True)
 
-for eq in solvable_eqs:
-    print(latex.doprint(Eq(eq, 0)))
-
-non_odeqs = [eq for eq in solvable_eqs if not eq.atoms(Derivative)]
-odeqs = [eq for eq in solvable_eqs if eq.atoms(Derivative)]
-
-solved_eqs = []
+if VERBOSE:
+    for eq in solvable_eqs:
+        print(latex.doprint(Eq(eq, 0)))
+
+# Classify each equation in one tree walk instead of one walk per
+# comprehension
+has_deriv = [(eq, bool(eq.atoms(Derivative))) for eq in solvable_eqs]
+non_odeqs = [eq for eq, deriv in has_deriv if not deriv]
+odeqs = [eq for eq, deriv in has_deriv if deriv]
+
+# Substituting the solution of the algebraic equations into the ODEs
+# can strip their derivatives and yield further algebraic equations.
+# Each round therefore solves only the newly found equations, which are
+# already expressed in the remaining free functions, and composes the
+# substitutions, instead of re-solving the growing full system.
+solution = {}
 while non_odeqs:
-    func_solutions = linsolve(solved_eqs + non_odeqs, arbitrary_functions)
-    solution = dict(zip(arbitrary_functions, tuple(func_solutions)[0]))
-
-    new_solvable_eqs = [eq.subs(solution).doit() for eq in odeqs]
-
-    solved_eqs += non_odeqs
-
-    non_odeqs = [eq for eq in new_solvable_eqs
-                 if not eq.atoms(Derivative) and not eq.is_zero]
-    odeqs = [eq for eq in new_solvable_eqs if eq.atoms(Derivative)]
+    func_solutions = linsolve(non_odeqs, arbitrary_functions)
+    new_solution = dict(
+        (func, value) for func, value
+        in zip(arbitrary_functions, tuple(func_solutions)[0])
+        if value != func)
+
+    solution = dict(
+        (func, value.xreplace(new_solution))
+        for func, value in solution.items())
+    solution.update(new_solution)
+
+    # The solutions map whole function nodes, so the cheaper exact-tree
+    # xreplace can be used instead of subs
+    new_solvable_eqs = [eq.xreplace(new_solution).doit() for eq in odeqs]
+
+    has_deriv = [(eq, bool(eq.atoms(Derivative))) for eq in new_solvable_eqs]
+    non_odeqs = [eq for eq, deriv in has_deriv
+                 if not deriv and not eq.is_zero]
+    odeqs = [eq for eq, deriv in has_deriv if deriv]
+
+solution.update((func, func) for func in arbitrary_functions
+                if func not in solution)
 
 # Index quick fix for algebraicly dependent equations
 solution_raw = dsolve(odeqs[1:], [f1, f3, f5, f7, f9])
@@ -4,6 +4,7 @@ import os.path
 import numpy as np
 from scipy.integrate import ode
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 from symmetries.visualize.utils import integrate_two_ways, get_spread
 
@@ -18,13 +19,20 @@ def plot(save_path=None, file_name="gompertz-autonomous-solutions.eps"):
 
     params = {"A": 3, "kG": 1}
 
-    def autonomous_rhs(t, W, kG=1, A=1):
+    # log(W / A) is expanded to log(W) - log(A) so that the division
+    # inside the logarithm is constant-folded out of the right hand side
+    def autonomous_rhs(t, W, kG=params["kG"], logA=np.log(params["A"])):
         """The autonomous Gompertz model."""
 
-        dWdt = - kG * np.log(W / A) * W
+        dWdt = - kG * (np.log(W) - logA) * W
         return dWdt
 
-    integrator = ode(lambda t, W: autonomous_rhs(t, W, **params))
+    def autonomous_jac(t, W, kG=params["kG"], logA=np.log(params["A"])):
+        """The Jacobian of the autonomous Gompertz model."""
+
+        return np.diag(np.atleast_1d(- kG * (np.log(W) - logA + 1)))
+
+    integrator = ode(autonomous_rhs, autonomous_jac)
     integrator.set_integrator('vode', method='adams')
 
     tlim_diff = tlim[1] - tlim[0]
@@ -34,19 +42,48 @@ def plot(save_path=None, file_name="gompertz-autonomous-solutions.eps"):
 
     init_vals = get_spread(include_init_val, (-2, 1), (2, 1),
                            NUM_SOLUTION_LINES)
-    for init_val in init_vals:
-        integrator.set_initial_value(init_val[1], init_val[0])
 
-        time_points, solut = integrate_two_ways(integrator, dt,
-                                                max_len=tlim_diff,
-                                                t_boundry=tlim, y_boundry=Wlim)
+    # The solution lines all pass through the same state and the model
+    # is autonomous, so every line is a time translate of the line
+    # through the included initial value. Integrate that line once over
+    # a window covering all translates and redraw it shifted.
+    init_ts = init_vals[:, 0]
+
+    integrator.set_initial_value(include_init_val[1], include_init_val[0])
 
-        is_include_init_val = np.allclose(init_val, include_init_val)
-        color = "black" if is_include_init_val else None
-        zorder = 2 if is_include_init_val else 1
-        linewidth = 2 if is_include_init_val else 1
+    shifted_tlim = (tlim[0] - init_ts.max(), tlim[1] - init_ts.min())
 
-        ax.plot(time_points, solut, color=color, zorder=zorder, lw=linewidth)
+    time_points, solut = integrate_two_ways(
+        integrator, dt, max_len=shifted_tlim[1] - shifted_tlim[0],
+        t_boundry=shifted_tlim, y_boundry=Wlim)
+
+    # Draw all solution lines as one collection instead of one Line2D
+    # artist per line. The included initial value's line goes last in
+    # the collection so that it is painted on top of the others.
+    color_cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+
+    line_segments = []
+    colors = []
+    linewidths = []
+
+    for init_val in init_vals:
+        segment = np.column_stack((time_points + init_val[0], solut))
+
+        if np.allclose(init_val, include_init_val):
+            include_segment = segment
+        else:
+            colors.append(color_cycle[len(line_segments) % len(color_cycle)])
+            line_segments.append(segment)
+            linewidths.append(1)
+
+    line_segments.append(include_segment)
+    colors.append("black")
+    linewidths.append(2)
+
+    ax.add_collection(LineCollection(line_segments, colors=colors,
+                                     linewidths=linewidths, zorder=2,
+                                     capstyle="projecting",
+                                     joinstyle="round"))
 
     ax.set_xlim(tlim)
     ax.set_ylim(Wlim)
@@ -35,6 +35,29 @@ X_aut6 = Generator(exp(-kG * t), -kG * exp(-kG * t) * W * ln(W))
 
 generators = [X_aut1, X_aut2, X_aut3, X_aut4, X_aut5, X_aut6]
 
+params = {A: 3, kG: 1}
+
+coords = (jet_space.original_total_space[0]
+          + jet_space.original_total_space[1])
+
+# Compile the right hand side and its Jacobian once at import time so
+# that repeated plot() calls reuse the same callables. The parameter
+# values are baked in instead of being passed on every evaluation.
+rhs_func = lambdify(coords, autonomous_rhs.subs(params), cse=True)
+
+
+def diff_eq(t, y):
+    """The differential equation as a python function."""
+    return rhs_func(t, y[0])
+
+
+jac_func = lambdify(coords, autonomous_rhs.diff(W).subs(params), cse=True)
+
+
+def diff_eq_jac(t, y):
+    """The Jacobian of the differential equation."""
+    return [[jac_func(t, y[0])]]
+
 
 def plot(save_path=None, file_names=["gompertz-autonomous-ansatz.eps",
                                      "gompertz-autonomous-param.eps"],
@@ -48,30 +71,17 @@ def plot(save_path=None, file_names=["gompertz-autonomous-ansatz.eps",
     #num_solution_lines = 11
     trans_max_lens = [10, 1, 2, 2, 1, 10]
 
-    params = {A: 3, kG: 1}
-
-    param_syms, param_vals = zip(*params.items())
-
-    coords = (jet_space.original_total_space[0]
-              + jet_space.original_total_space[1])
-
-    rhs_func = lambdify(coords + list(param_syms), autonomous_rhs)
-
-    def diff_eq(t, y):
-        """The differential equation as a python function."""
-        return rhs_func(t, *y, *param_vals)
-
     # Plot generators from ansatz
     fig, axs = plt.subplots(1, 3, sharex=True, sharey=True, figsize=(9, 3))
 
     all_axs = axs.flat
-    ansatz_iter_bundle = ((i, gen, max_len) for i, (gen, max_len)
-                          in enumerate(zip(generators, trans_max_lens),
-                                       start=1)
-                          if i in [1, 2, 3])
-    for i, gen, max_len, ax in zip(*zip(*ansatz_iter_bundle), all_axs):
+    ansatz_items = [(i, gen, max_len) for i, (gen, max_len)
+                    in enumerate(zip(generators, trans_max_lens), start=1)
+                    if i in {1, 2, 3}]
+    for (i, gen, max_len), ax in zip(ansatz_items, all_axs):
         plot_transformation(gen, ax, diff_eq, (0, 1), tlim=tlim, ylim=Wlim,
                             parameters=params, trans_max_len=max_len,
+                            diff_eq_jac=diff_eq_jac,
                             **transformation_kw_args)
 
         ax.set_title(f"$X_{{\\mathrm{{a}},{i}}}$")
@@ -94,13 +104,14 @@ def plot(save_path=None, file_names=["gompertz-autonomous-ansatz.eps",
     # Plot generators from parameter independence
     fig, axs = plt.subplots(2, 3, sharex=True, sharey=True, figsize=(9, 6))
 
-    param_iter_bundle = ((i, gen, max_len) for i, (gen, max_len)
-                         in enumerate(zip(generators, trans_max_lens), start=1)
-                         if i in [2, 3, 4, 5, 6])
+    param_items = [(i, gen, max_len) for i, (gen, max_len)
+                   in enumerate(zip(generators, trans_max_lens), start=1)
+                   if i in {2, 3, 4, 5, 6}]
     all_axs = axs.flat
-    for i, gen, max_len, ax in zip(*zip(*param_iter_bundle), all_axs):
+    for (i, gen, max_len), ax in zip(param_items, all_axs):
         plot_transformation(gen, ax, diff_eq, (0, 1), tlim=tlim, ylim=Wlim,
                             parameters=params, trans_max_len=max_len,
+                            diff_eq_jac=diff_eq_jac,
                             **transformation_kw_args)
 
         ax.set_title(f"$X_{{\\mathrm{{a}},{i}}}$")
@@ -4,6 +4,7 @@ import os.path
 import numpy as np
 from scipy.integrate import ode
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 from symmetries.visualize.utils import integrate_two_ways, get_spread
 
@@ -18,14 +19,24 @@ def plot(save_path=None, file_name="gompertz-classical-solutions.eps"):
 
     params = {"Ti": np.log(np.log(3)), "kG": 1}
 
-    def classical_rhs(t, W, kG=1, Ti=1):
+    # The constant factor k_G * exp(k_G * T_i) is folded out of the
+    # exponential so that only exp(-k_G * t) remains per evaluation
+    kG_exp_kGTi = params["kG"] * np.exp(params["kG"] * params["Ti"])
+
+    def classical_rhs(t, W, kG=params["kG"], c=kG_exp_kGTi):
         """The classical Gompertz model with
         :math:`T_i`-parametrization.
         """
-        dWdt = kG * np.exp(-kG * (t - Ti)) * W
+        dWdt = c * np.exp(-kG * t) * W
         return dWdt
 
-    integrator = ode(lambda t, W: classical_rhs(t, W, **params))
+    def classical_jac(t, W, kG=params["kG"], c=kG_exp_kGTi):
+        """The Jacobian of the classical Gompertz model."""
+
+        return np.diag(np.full_like(np.atleast_1d(W),
+                                    c * np.exp(-kG * t)))
+
+    integrator = ode(classical_rhs, classical_jac)
     integrator.set_integrator('vode', method='adams')
 
     tlim_diff = tlim[1] - tlim[0]
@@ -35,19 +46,43 @@ def plot(save_path=None, file_name="gompertz-classical-solutions.eps"):
 
     init_vals = get_spread(include_init_val, (0, 0.2), (0, 1.8),
                            NUM_SOLUTION_LINES)
-    for init_val in init_vals:
-        integrator.set_initial_value(init_val[1], init_val[0])
-
-        time_points, solut = integrate_two_ways(integrator, dt,
-                                                max_len=tlim_diff,
-                                                t_boundry=tlim, y_boundry=Wlim)
-
-        is_include_init_val = np.allclose(init_val, include_init_val)
-        color = "black" if is_include_init_val else None
-        zorder = 2 if is_include_init_val else 1
-        linewidth = 2 if is_include_init_val else 1
 
-        ax.plot(time_points, solut, color=color, zorder=zorder, lw=linewidth)
+    # All solution lines start at the same time, so they can be
+    # advanced in lockstep as a single vector-valued ODE instead of one
+    # integrator run per line
+    integrator.set_initial_value(init_vals[:, 1], init_vals[0, 0])
+
+    time_points, solut = integrate_two_ways(
+        integrator, dt, max_len=tlim_diff, t_boundry=tlim,
+        y_boundry=[Wlim] * NUM_SOLUTION_LINES)
+
+    # Draw all solution lines as one collection instead of one Line2D
+    # artist per line. The included initial value's line goes last in
+    # the collection so that it is painted on top of the others.
+    color_cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+
+    line_segments = []
+    colors = []
+    linewidths = []
+
+    for i, init_val in enumerate(init_vals):
+        segment = np.column_stack((time_points, solut[:, i]))
+
+        if np.allclose(init_val, include_init_val):
+            include_segment = segment
+        else:
+            colors.append(color_cycle[len(line_segments) % len(color_cycle)])
+            line_segments.append(segment)
+            linewidths.append(1)
+
+    line_segments.append(include_segment)
+    colors.append("black")
+    linewidths.append(2)
+
+    ax.add_collection(LineCollection(line_segments, colors=colors,
+                                     linewidths=linewidths, zorder=2,
+                                     capstyle="projecting",
+                                     joinstyle="round"))
 
     ax.set_xlim(tlim)
     ax.set_ylim(Wlim)
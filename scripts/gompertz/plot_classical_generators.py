@@ -36,6 +36,21 @@ X_cla5 = Generator(1, - kG * W * ln(W))
 
 generators = [X_cla1, X_cla2, X_cla3, X_cla4, X_cla5]
 
+params = {Ti: math.log(math.log(3)), kG: 1}
+
+coords = (jet_space.original_total_space[0]
+          + jet_space.original_total_space[1])
+
+# Compile the right hand side once at import time so that repeated
+# plot() calls reuse the same callable. The parameter values are baked
+# in instead of being passed on every evaluation.
+rhs_func = lambdify(coords, classical_rhs.subs(params), cse=True)
+
+
+def diff_eq(t, y):
+    """The differential equation as a python function."""
+    return rhs_func(t, y[0])
+
 
 def plot(save_path=None, file_names=["gompertz-classical-local.eps",
                                      "gompertz-classical-ansatz.eps",
@@ -57,37 +72,28 @@ def plot(save_path=None, file_names=["gompertz-classical-local.eps",
 
     trans_max_lens = [0.15, 0.07, 0.6, 0.2, 1]
 
-    params = {Ti: math.log(math.log(3)), kG: 1}
-
-    param_syms, param_vals = zip(*params.items())
-
-    coords = (jet_space.original_total_space[0]
-              + jet_space.original_total_space[1])
-
-    rhs_func = lambdify(coords + list(param_syms), classical_rhs)
-
-    def diff_eq(t, y):
-        """The differential equation as a python function."""
-        return rhs_func(t, *y, *param_vals)
-
     # Plot vector fields of local transformations
     fig, axs = plt.subplots(1, 2, sharex=True, sharey=True, figsize=(6, 3))
 
     ts, Ws = np.meshgrid(np.linspace(*tlim, 10), np.linspace(*Wlim, 10))
 
     all_axs = axs.flat
-    nonlocal_iter_bundle = ((i, gen) for i, (gen,)
-                            in enumerate(zip(generators), start=1)
-                            if i in [1, 2])
-    for i, gen, ax in zip(*zip(*nonlocal_iter_bundle), all_axs):
+    nonlocal_items = [(i, gen) for i, gen in enumerate(generators, start=1)
+                      if i in {1, 2}]
+    for (i, gen), ax in zip(nonlocal_items, all_axs):
         plot_solution_curve(ax, diff_eq, (0, 1), tlim=tlim, ylim=Wlim)
 
-        xi_evals = [math.log(1 + gen.xis[0].subs(zip((t, W),
-                                                     point)).subs(params))
-                    for point in zip(ts.flat, Ws.flat)]
-        eta_evals = [math.log(1 + gen.etas[0].subs(zip((t, W),
-                                                       point)).subs(params))
-                    for point in zip(ts.flat, Ws.flat)]
+        # Evaluate the tangent field over the whole grid at once, so
+        # that the exponential factors shared by the components are
+        # computed once per grid instead of once per point
+        xi_func = lambdify((t, W), ln(1 + gen.xis[0].subs(params)), cse=True)
+        eta_func = lambdify((t, W), ln(1 + gen.etas[0].subs(params)),
+                            cse=True)
+
+        xi_evals = np.broadcast_to(np.asarray(xi_func(ts, Ws), dtype=float),
+                                   ts.shape)
+        eta_evals = np.broadcast_to(np.asarray(eta_func(ts, Ws), dtype=float),
+                                    Ws.shape)
 
         ax.quiver(ts, Ws, xi_evals, eta_evals, zorder=3, headwidth=5)
 
@@ -108,11 +114,10 @@ def plot(save_path=None, file_names=["gompertz-classical-local.eps",
 
     # Iteration over axes
     all_axs = np.array(axs).flat
-    ansatz_iter_bundle = ((i, gen, max_len) for i, (gen, max_len)
-                          in enumerate(zip(generators, trans_max_lens),
-                                       start=1)
-                          if i in [3])
-    for i, gen, max_len, ax in zip(*zip(*ansatz_iter_bundle), all_axs):
+    ansatz_items = [(i, gen, max_len) for i, (gen, max_len)
+                    in enumerate(zip(generators, trans_max_lens), start=1)
+                    if i in {3}]
+    for (i, gen, max_len), ax in zip(ansatz_items, all_axs):
         plot_transformation(gen, ax, diff_eq, (0, 1), tlim=tlim, ylim=Wlim,
                             parameters=params, trans_max_len=max_len,
                             **transformation_kw_args)
@@ -139,10 +144,10 @@ def plot(save_path=None, file_names=["gompertz-classical-local.eps",
 
     # Iteration over axes
     all_axs = axs.flat
-    param_iter_bundle = ((i, gen, max_len) for i, (gen, max_len)
-                         in enumerate(zip(generators, trans_max_lens), start=1)
-                         if i in [4, 5])
-    for i, gen, max_len, ax in zip(*zip(*param_iter_bundle), all_axs):
+    param_items = [(i, gen, max_len) for i, (gen, max_len)
+                   in enumerate(zip(generators, trans_max_lens), start=1)
+                   if i in {4, 5}]
+    for (i, gen, max_len), ax in zip(param_items, all_axs):
         plot_transformation(gen, ax, diff_eq, (0, 1), tlim=tlim, ylim=Wlim,
                             parameters=params, trans_max_len=max_len,
                             **transformation_kw_args)
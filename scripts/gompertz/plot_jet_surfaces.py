@@ -8,7 +8,6 @@ import os.path
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import to_rgba
-from scipy.interpolate import interp1d
 from sympy import symbols
 
 from symmetries import generator_on
@@ -18,6 +17,14 @@ from symmetries.visualize import plot_transformation_curves
 FIG_WIDTH = 9
 FIG_HEIGHT = 6
 
+# Symbolic setup shared by both surface plots, done once per process so
+# that repeated plot() calls only redo the numeric surface data
+t, W = symbols("t W")
+Generator = generator_on(((t,), (W,)))
+
+cla_generator = Generator(0, W)
+aut_generator = Generator(1, 0)
+
 
 def plot(save_path=None, file_names=["classical-gompertz-surface.pdf",
                                      "autonomous-gompertz-surface.pdf"],
@@ -48,8 +55,10 @@ def plot(save_path=None, file_names=["classical-gompertz-surface.pdf",
     Wlim = (0.001, 4.2)
     dWdtlim = (-4, 2)
 
-    t_vec = np.linspace(*tlim, 50)
-    W_vec = np.linspace(*Wlim, 50)
+    # Single precision is plenty for rendering and halves the data the
+    # surface projection pipeline has to traverse
+    t_vec = np.linspace(*tlim, 50, dtype=np.float32)
+    W_vec = np.linspace(*Wlim, 50, dtype=np.float32)
 
     default_params = {"A": 3, "Ti": np.log(np.log(3)), "kG": 1}
 
@@ -113,14 +122,14 @@ def plot_classical_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
         plotted.
     :type plot_surface: bool, optional
     """
-    # Set up symbolic parameters
-    t, W = symbols("t W")
-    Generator = generator_on(((t,), (W,)))
-
     kG = default_params["kG"]
     Ti = default_params["Ti"]
 
-    surf_ts, surf_Ws = np.meshgrid(t_vec, W_vec)
+    # Broadcast strided views of the coordinate vectors instead of
+    # materializing two full meshgrid arrays
+    grid_shape = (len(W_vec), len(t_vec))
+    surf_ts = np.broadcast_to(t_vec[None, :], grid_shape)
+    surf_Ws = np.broadcast_to(W_vec[:, None], grid_shape)
     surf_dWdts = kG * np.exp(-kG * (surf_ts - Ti)) * surf_Ws
     surf_ts, surf_Ws, surf_dWdts = crop_surface(surf_ts, surf_Ws, surf_dWdts,
                                                 dWdtlim)
@@ -130,14 +139,20 @@ def plot_classical_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
                            figsize=(FIG_WIDTH, FIG_HEIGHT))
 
     if plot_surface:
-        ax.plot_surface(surf_ts, surf_Ws, surf_dWdts,
-                        antialiased=False, color=to_rgba("C0", 0.85),
-                        edgecolors=to_rgba("C0", 0), linewidths=0.0)
+        surf = ax.plot_surface(surf_ts, surf_Ws, surf_dWdts,
+                               antialiased=False, color=to_rgba("C0", 0.85),
+                               edgecolors=to_rgba("C0", 0), linewidths=0.0)
+        # Rasterize only the surface so that the vector output does not
+        # embed thousands of projected polygons
+        surf.set_rasterized(True)
 
     def get_classical_lines(ts, A):
         line_ts = np.copy(ts)
-        line_Ws = A * np.exp(-np.exp(-kG * (line_ts - Ti)))
-        line_dWdts = kG * np.exp(-kG * (line_ts - Ti)) * line_Ws
+        # The exponential factor is shared by the size and its
+        # derivative, so compute it once
+        exp_factor = np.exp(-kG * (line_ts - Ti))
+        line_Ws = A * np.exp(-exp_factor)
+        line_dWdts = kG * exp_factor * line_Ws
 
         mask = (line_Ws > Wlim[0]) & (line_Ws < Wlim[1])
 
@@ -147,21 +162,21 @@ def plot_classical_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
 
         return line_ts, line_Ws, line_dWdts
 
-    for A in (default_params["A"], default_params["A"] + 1):
-
-        line_ts, line_Ws, line_dWdts = get_classical_lines(t_vec, A)
+    # The default parameter line is both drawn and reused as the base
+    # of the transformation curves, so compute each line only once
+    lines = {A: get_classical_lines(t_vec, A)
+             for A in (default_params["A"], default_params["A"] + 1)}
 
+    for line_ts, line_Ws, line_dWdts in lines.values():
         if plot_lifts:
             ax.plot(line_ts, line_Ws, line_dWdts, color="black", zorder=4)
         if plot_projection:
             ax.plot(line_ts, line_Ws, dWdtlim[0], color="black")
 
-    cla_generator = Generator(0, W)
-
-    default_line = get_classical_lines(t_vec, default_params["A"])
+    default_line = lines[default_params["A"]]
 
     if plot_lifts:
-        plot_transformation_curves(ax, np.stack(default_line, axis=1),
+        plot_transformation_curves(ax, np.column_stack(default_line),
                                    cla_generator, default_params, tlim,
                                    (Wlim, dWdtlim),
                                    trans_max_len=np.log(4 / 3), in2d=False,
@@ -196,7 +211,7 @@ def plot_classical_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
 
         file_path = os.path.join(save_path, file_name)
 
-        plt.savefig(file_path, format="pdf", bbox_inches=bbox)
+        plt.savefig(file_path, format="pdf", bbox_inches=bbox, dpi=300)
 
 
 def plot_autonomous_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
@@ -246,14 +261,14 @@ def plot_autonomous_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
         plotted.
     :type plot_surface: bool, optional
     """
-    # Set up symbolic parameters
-    t, W = symbols("t W")
-    Generator = generator_on(((t,), (W,)))
-
     kG = default_params["kG"]
     A = default_params["A"]
 
-    surf_ts, surf_Ws = np.meshgrid(t_vec, W_vec)
+    # Broadcast strided views of the coordinate vectors instead of
+    # materializing two full meshgrid arrays
+    grid_shape = (len(W_vec), len(t_vec))
+    surf_ts = np.broadcast_to(t_vec[None, :], grid_shape)
+    surf_Ws = np.broadcast_to(W_vec[:, None], grid_shape)
     surf_dWdts = - kG * np.log(surf_Ws / A) * surf_Ws
 
     fig, ax = plt.subplots(subplot_kw=dict(projection="3d",
@@ -261,14 +276,20 @@ def plot_autonomous_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
                            figsize=(FIG_WIDTH, FIG_HEIGHT))
 
     if plot_surface:
-        ax.plot_surface(surf_ts, surf_Ws, surf_dWdts, antialiased=False,
-                        color=to_rgba("C0", 0.85), edgecolors=to_rgba("C0", 0),
-                        linewidths=0.0)
+        surf = ax.plot_surface(surf_ts, surf_Ws, surf_dWdts,
+                               antialiased=False, color=to_rgba("C0", 0.85),
+                               edgecolors=to_rgba("C0", 0), linewidths=0.0)
+        # Rasterize only the surface so that the vector output does not
+        # embed thousands of projected polygons
+        surf.set_rasterized(True)
 
     def get_autonomous_lines(ts, Ti):
         line_ts = np.copy(ts)
-        line_Ws = A * np.exp(-np.exp(-kG * (line_ts - Ti)))
-        line_dWdts = -kG * np.log(line_Ws / A) * line_Ws
+        # On the solution lines log(W / A) equals minus the exponential
+        # factor, so the logarithm and division need not be evaluated
+        exp_factor = np.exp(-kG * (line_ts - Ti))
+        line_Ws = A * np.exp(-exp_factor)
+        line_dWdts = kG * exp_factor * line_Ws
 
         mask = (line_Ws > Wlim[0]) & (line_Ws < Wlim[1])
 
@@ -278,21 +299,21 @@ def plot_autonomous_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
 
         return line_ts, line_Ws, line_dWdts
 
-    for Ti in (default_params["Ti"], default_params["Ti"] + 3):
-
-        line_ts, line_Ws, line_dWdts = get_autonomous_lines(t_vec, Ti)
+    # The default parameter line is both drawn and reused as the base
+    # of the transformation curves, so compute each line only once
+    lines = {Ti: get_autonomous_lines(t_vec, Ti)
+             for Ti in (default_params["Ti"], default_params["Ti"] + 3)}
 
+    for line_ts, line_Ws, line_dWdts in lines.values():
         if plot_lifts:
             ax.plot(line_ts, line_Ws, line_dWdts, color="black", zorder=4)
         if plot_projection:
             ax.plot(line_ts, line_Ws, dWdtlim[0], color="black")
 
-    aut_generator = Generator(1, 0)
-
-    default_line = get_autonomous_lines(t_vec, default_params["Ti"])
+    default_line = lines[default_params["Ti"]]
 
     if plot_lifts:
-        plot_transformation_curves(ax, np.stack(default_line, axis=1),
+        plot_transformation_curves(ax, np.column_stack(default_line),
                                    aut_generator, default_params, tlim,
                                    (Wlim, dWdtlim), trans_max_len=3,
                                    in2d=False, jet_space_order=1, strict=True)
@@ -326,7 +347,7 @@ def plot_autonomous_surface(default_params, t_vec, W_vec, tlim, Wlim, dWdtlim,
 
         file_path = os.path.join(save_path, file_name)
 
-        plt.savefig(file_path, format="pdf", bbox_inches=bbox)
+        plt.savefig(file_path, format="pdf", bbox_inches=bbox, dpi=300)
 
 
 def crop_surface(xs, ys, zs, zlim):
@@ -355,46 +376,48 @@ def crop_surface(xs, ys, zs, zlim):
     new_ys = np.copy(ys)
     new_zs = np.copy(zs)
     # Cropped vertices are assigned NaN
-    new_zs[np.logical_not(up_mask & down_mask)] = np.NaN
+    new_zs[np.logical_not(up_mask & down_mask)] = np.nan
 
     for mask, lim in zip((down_mask, up_mask), zlim):
+        # Cropped vertices that have already been moved are tracked in a
+        # boolean grid so that each vertex is only moved by the first
+        # edge direction that touches it
+        patched = np.zeros(zs.shape, dtype=bool)
+
+        def patch_edges(i_vec, j_vec, new_coords, coords, di, dj):
+            # Move the edge vertices of one direction to the linearly
+            # interpolated edge of the cropping, all at once. The
+            # neighbouring vertex at offset (di, dj) is the visible end
+            # of each crossing edge.
+            unpatched = ~patched[i_vec, j_vec]
+            i_vec = i_vec[unpatched]
+            j_vec = j_vec[unpatched]
+
+            z0 = zs[i_vec + di, j_vec + dj]
+            z1 = zs[i_vec, j_vec]
+            c0 = coords[i_vec + di, j_vec + dj]
+            c1 = coords[i_vec, j_vec]
+
+            new_coords[i_vec, j_vec] = c0 + (lim - z0) * (c1 - c0) / (z1 - z0)
+            new_zs[i_vec, j_vec] = lim
+            patched[i_vec, j_vec] = True
+
         # Find the cropped vertices at the edges of the visible surface
-        left_edge_vertices = {(i + 1, j) for i, j
-                              in zip(*np.where(mask[:-1,:] & ~mask[1:,:]))}
-        right_edge_vertices = set(zip(*np.where(mask[1:,:] & ~mask[:-1,:])))
-        front_edge_vertices = {(i, j + 1) for i, j
-                               in zip(*np.where(mask[:,:-1] & ~mask[:,1:]))}
-        back_edge_vertices = set(zip(*np.where(mask[:,1:] & ~mask[:,:-1])))
-
-        # Move edge vertices to the interpolated edge of the cropping
-        patched_vertices = []
-
-        # The order of adjustment is arbitrary. Vertices with many edge
-        # connections could be diagonally interpolated, but visual
-        # results are not significantly improved.
-        for i, j in front_edge_vertices:
-            if (i, j) not in patched_vertices:
-                new_xs[i, j] = interp1d(zs[i, j-1:j+1], xs[i, j-1:j+1])(lim)
-                new_zs[i, j] = lim
-                patched_vertices.append((i, j))
-
-        for i, j in back_edge_vertices:
-            if (i, j) not in patched_vertices:
-                new_xs[i, j] = interp1d(zs[i, j:j+2], xs[i, j:j+2])(lim)
-                new_zs[i, j] = lim
-                patched_vertices.append((i, j))
-
-        for i, j in right_edge_vertices:
-            if (i, j) not in patched_vertices:
-                new_ys[i, j] = interp1d(zs[i-1:i+1, j], ys[i-1:i+1, j])(lim)
-                new_zs[i, j] = lim
-                patched_vertices.append((i, j))
-
-        for i, j in left_edge_vertices:
-            if (i, j) not in patched_vertices:
-                new_ys[i, j] = interp1d(zs[i:i+2, j], ys[i:i+2, j])(lim)
-                new_zs[i, j] = lim
-                patched_vertices.append((i, j))
+        # in each direction. The order of adjustment is arbitrary.
+        # Vertices with many edge connections could be diagonally
+        # interpolated, but visual results are not significantly
+        # improved.
+        front_i, front_j = np.where(mask[:,:-1] & ~mask[:,1:])
+        patch_edges(front_i, front_j + 1, new_xs, xs, 0, -1)
+
+        back_i, back_j = np.where(mask[:,1:] & ~mask[:,:-1])
+        patch_edges(back_i, back_j, new_xs, xs, 0, 1)
+
+        right_i, right_j = np.where(mask[1:,:] & ~mask[:-1,:])
+        patch_edges(right_i, right_j, new_ys, ys, -1, 0)
+
+        left_i, left_j = np.where(mask[:-1,:] & ~mask[1:,:])
+        patch_edges(left_i + 1, left_j, new_ys, ys, 1, 0)
 
     return new_xs, new_ys, new_zs
 
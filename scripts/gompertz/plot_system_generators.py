@@ -5,10 +5,12 @@ import math
 import os.path
 
 from sympy import symbols, ln, exp, lambdify
+from scipy.integrate import ode
 import matplotlib.pyplot as plt
 
 from symmetries import generator_on, JetSpace
 from symmetries.visualize import plot_transformation
+from symmetries.visualize.utils import integrate_two_ways
 
 
 # Time
@@ -56,12 +58,24 @@ def plot(save_path=None, file_names=["gompertz-system-ansatz.eps",
     coords = (jet_space.original_total_space[0]
               + jet_space.original_total_space[1])
 
-    rhs_func = lambdify(coords + list(param_syms), system_rhs)
+    rhs_func = lambdify(coords + list(param_syms), system_rhs,
+                        modules="numpy", cse=True)
 
     def diff_eq(t, y):
         """The differential equation as a python function."""
         return rhs_func(t, *y, *param_vals)
 
+    init_val = (0, 1, math.log(3))
+
+    # All transformations are plotted around the same solution curve,
+    # so it is integrated once and shared between the subfigures
+    integrator = ode(diff_eq).set_integrator('vode', method='adams')
+    integrator.set_initial_value(init_val[1:], init_val[0])
+
+    base_curve = integrate_two_ways(integrator, 0.1,
+                                    max_len=tlim[1] - tlim[0],
+                                    t_boundry=tlim, y_boundry=(Wlim, Glim))
+
     # Plot generators from ansatz
     fig = plt.figure(constrained_layout=True, figsize=(12, 9))
     subfigs = fig.subfigures(3, 2).flat
@@ -72,9 +86,10 @@ def plot(save_path=None, file_names=["gompertz-system-ansatz.eps",
                           if i in [1, 2, 3, 4, 5])
     for i, gen, max_len, subfig in zip(*zip(*ansatz_iter_bundle), subfigs):
         axs = subfig.subplots(1, 2)
-        plot_transformation(gen, axs, diff_eq, (0, 1, math.log(3)), tlim=tlim,
+        plot_transformation(gen, axs, diff_eq, init_val, tlim=tlim,
                             ylim=(Wlim, Glim), parameters=params,
-                            trans_max_len=max_len, **transformation_kw_args)
+                            trans_max_len=max_len, base_curve=base_curve,
+                            **transformation_kw_args)
 
         subfig.suptitle(f"$X_{{\\mathrm{{s}},{i}}}$")
         axs[0].set_xlim(tlim)
@@ -102,9 +117,10 @@ def plot(save_path=None, file_names=["gompertz-system-ansatz.eps",
                           if i in [1, 4, 6])
     for i, gen, max_len, subfig in zip(*zip(*ansatz_iter_bundle), subfigs):
         axs = subfig.subplots(1, 2)
-        plot_transformation(gen, axs, diff_eq, (0, 1, math.log(3)), tlim=tlim,
+        plot_transformation(gen, axs, diff_eq, init_val, tlim=tlim,
                             ylim=(Wlim, Glim), parameters=params,
-                            trans_max_len=max_len, **transformation_kw_args)
+                            trans_max_len=max_len, base_curve=base_curve,
+                            **transformation_kw_args)
 
         subfig.suptitle(f"$X_{{\\mathrm{{s}},{i}}}$")
         axs[0].set_xlim(tlim)
@@ -1,6 +1,10 @@
 """Calculate generators linear in time and states for lac operon model.
 """
-from sympy import symbols, together, numer, poly, linsolve, Function, Eq
+import os
+from multiprocessing import get_context
+
+from sympy import (symbols, together, numer, poly, linsolve, Function, Eq,
+                   S)
 
 from symmetries import (JetSpace, get_lin_symmetry_cond, Generator,
                         decompose_generator)
@@ -57,7 +61,7 @@ for i, eta in enumerate(inf_generator.etas, start=1):
     print_eta = poly(eta, ansatz_consts + [t] + list(states))
     print(latex.doprint(Eq(Function(f"\\eta^{i}")(t, *states), print_eta)))
 
-first_derivatives = (fibers[(1,)] for _, fibers in jet_space.fibers.items())
+first_derivatives = jet_space.first_derivatives
 lin_symmetry_cond = get_lin_symmetry_cond(diff_functions, inf_generator,
                                           jet_space,
                                           derivative_hints=first_derivatives)
@@ -68,20 +72,75 @@ num_decomposed_eqs = 0
 print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
       end="", flush=True)
 
-solvable_eqs = []
-for eq in lin_symmetry_cond:
+def decompose_eq(eq):
+    """Decompose one symmetry condition equation into the coefficient
+    equations of its polynomial form.
+    """
     eq_numer = numer(together(eq))
-    solvable_eqs += poly(eq_numer, (time,) + states + (A ** n,)).coeffs()
+    return poly(eq_numer, (time,) + states + (A ** n,)).coeffs()
+
+
+# The equations decompose independently of each other, so spread them
+# over worker processes when more than one core is available. The fork
+# context is used since this script runs all its work at import and
+# must not be re-executed in the workers.
+num_workers = min(num_eqs, os.cpu_count() or 1)
+
+if num_workers > 1:
+    pool = get_context("fork").Pool(num_workers)
+    decomposed_iter = pool.imap(decompose_eq, lin_symmetry_cond)
+else:
+    pool = None
+    decomposed_iter = map(decompose_eq, lin_symmetry_cond)
+
+solvable_eqs = []
+for coeff_eqs in decomposed_iter:
+    solvable_eqs += coeff_eqs
 
     num_decomposed_eqs += 1
     print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
           end="", flush=True)
 
+if pool:
+    pool.close()
+    pool.join()
+
 print(f"\nThe equation system has {str(len(solvable_eqs))} equations",
       flush=True)
 
-consts_sol = linsolve(solvable_eqs, ansatz_consts)
-solution = dict(zip(ansatz_consts, tuple(consts_sol)[0]))
+# Every decomposed equation is homogeneous in the ansatz constants, so
+# an equation containing a single constant forces that constant to
+# zero. Eliminating those cheaply first leaves linsolve only the
+# genuinely coupled part of the system.
+consts_set = set(ansatz_consts)
+solution = {}
+remaining_eqs = solvable_eqs
+while True:
+    new_zeroed = {}
+    coupled_eqs = []
+    for eq in remaining_eqs:
+        eq_consts = eq.free_symbols & consts_set
+        if len(eq_consts) == 1:
+            new_zeroed[eq_consts.pop()] = S.Zero
+        else:
+            coupled_eqs.append(eq)
+    if not new_zeroed:
+        break
+    solution.update(new_zeroed)
+    # The zeroed constants vanish structurally on xreplace, so an
+    # identity check suffices to drop the equations that became trivial
+    remaining_eqs = [eq for eq
+                     in (eq.xreplace(new_zeroed) for eq in coupled_eqs)
+                     if eq is not S.Zero]
+
+if remaining_eqs:
+    unsolved_consts = [const for const in ansatz_consts
+                       if const not in solution]
+    consts_sol = linsolve(remaining_eqs, unsolved_consts)
+    solution.update(zip(unsolved_consts, tuple(consts_sol)[0]))
+
+solution.update((const, const) for const in ansatz_consts
+                if const not in solution)
 xis = [xi.subs(solution) for xi in inf_generator.xis]
 etas = [eta.subs(solution) for eta in inf_generator.etas]
 
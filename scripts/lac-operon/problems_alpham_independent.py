@@ -1,7 +1,9 @@
 """Show the problems with finding :math:`\\alpha_M`-independent
 symmetries.
 """
-from sympy import symbols, Function, Derivative, Union
+import sys
+
+from sympy import symbols, Function, Derivative, S
 
 from symmetries import JetSpace, generator_on, get_lin_symmetry_cond
 from symmetries.utils import derivatives_sort_key
@@ -70,60 +72,101 @@ latex = CustomLatexPrinter({"ln_notation": True})
 sym_conds = get_lin_symmetry_cond(diff_eqs, Generator(xi, etas),
                                   jet_space, derivative_hints=derivatives)
 function_monoids = [xi, *etas]
-all_derivs = Union(*(sym_cond.expand().atoms(Derivative)
-                     for sym_cond in sym_conds))
+
+# The symmetry conditions are expanded once up front; both the
+# derivative collection and the decomposition below work on the
+# expanded forms
+expanded_sym_conds = [sym_cond.expand() for sym_cond in sym_conds]
+
+all_derivs = set().union(*(sym_cond.atoms(Derivative)
+                           for sym_cond in expanded_sym_conds))
 function_monoids += sorted(all_derivs,
                            key=derivatives_sort_key([xi, *etas], [t, *states]))
 
 num_eqs = len(sym_conds)
 num_decomposed_eqs = 0
 
-print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-      end="", flush=True)
+# Progress is reported in percent-sized batches so that the terminal
+# writes do not tax short decomposition iterations
+progress_step = max(1, num_eqs // 100)
+
+sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed")
+sys.stdout.flush()
 
 param_ind_det_eq_dicts = []
-for sym_cond in sym_conds:
-    param_ind_det_eq_dicts.append(sym_cond.expand().collect(alphaM,
+for expanded_sym_cond in expanded_sym_conds:
+    param_ind_det_eq_dicts.append(expanded_sym_cond.collect(alphaM,
                                                             evaluate=False))
 
     num_decomposed_eqs += 1
-    print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-          end="", flush=True)
+    if (num_decomposed_eqs % progress_step == 0
+            or num_decomposed_eqs == num_eqs):
+        sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations "
+                         "decomposed")
+        sys.stdout.flush()
 
 tot_num_eqs = sum(len(eq_dict) for eq_dict in param_ind_det_eq_dicts)
 print(f"\nThe equation system has {str(tot_num_eqs)} equations",
       flush=True)
 
+# The coefficients come from collecting an already expanded expression,
+# so they are still in expanded form
 print("Number of terms in the parameter independence determining equations:")
 for eq_num, eq_dict in enumerate(param_ind_det_eq_dicts):
     for key, eq in eq_dict.items():
         print(f"{derivatives[eq_num]}, {key}: "
-              f"{len(eq.expand().args)} terms")
+              f"{len(eq.args)} terms")
 
 # Since (1 + K1 * A ** n) / (K + K1 * A ** n) is not zero for all A > 0
 print("Eliminate M-derivatives from all functions but eta1:")
 
+old_xi = xi
+old_etas = list(etas)
+
 xi = Function("\\xi")(t, B, L, A, P)
 for i in range(2, 6):
     etas[i - 1] = Function(f"\\eta^{i}")(t, B, L, A, P)
 
-sym_conds = get_lin_symmetry_cond(diff_eqs, Generator(xi, etas),
-                                  jet_space, derivative_hints=derivatives)
-
-num_eqs = len(sym_conds)
+# The second stage generator only drops the M dependence of xi and
+# etas 2-5, so its symmetry conditions follow from the first stage
+# conditions by zeroing the M-derivatives of those functions and
+# relabeling them, instead of prolonging the full generator again
+reduced_funcs = dict(zip([old_xi] + old_etas[1:], [xi] + etas[1:]))
+
+reduction_subs = dict(reduced_funcs)
+for deriv in set().union(*(cond.atoms(Derivative)
+                           for cond in expanded_sym_conds)):
+    if deriv.expr in reduced_funcs:
+        if any(var == M for var, _ in deriv.variable_count):
+            reduction_subs[deriv] = S.Zero
+        else:
+            reduction_subs[deriv] = Derivative(reduced_funcs[deriv.expr],
+                                               *deriv.variable_count)
+
+expanded_sym_conds = [cond.xreplace(reduction_subs)
+                      for cond in expanded_sym_conds]
+
+num_eqs = len(expanded_sym_conds)
 num_decomposed_eqs = 0
 
-print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-      end="", flush=True)
+# Progress is reported in percent-sized batches so that the terminal
+# writes do not tax short decomposition iterations
+progress_step = max(1, num_eqs // 100)
+
+sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed")
+sys.stdout.flush()
 
 param_ind_det_eq_dicts = []
-for sym_cond in sym_conds:
-    param_ind_det_eq_dicts.append(sym_cond.expand().collect(alphaM,
+for expanded_sym_cond in expanded_sym_conds:
+    param_ind_det_eq_dicts.append(expanded_sym_cond.collect(alphaM,
                                                             evaluate=False))
 
     num_decomposed_eqs += 1
-    print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-          end="", flush=True)
+    if (num_decomposed_eqs % progress_step == 0
+            or num_decomposed_eqs == num_eqs):
+        sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations "
+                         "decomposed")
+        sys.stdout.flush()
 
 tot_num_eqs = sum(len(eq_dict) for eq_dict in param_ind_det_eq_dicts)
 print(f"\nThe equation system has {str(tot_num_eqs)} equations",
@@ -133,4 +176,4 @@ print("Number of terms in the parameter independence determining equations:")
 for eq_num, eq_dict in enumerate(param_ind_det_eq_dicts):
     for key, eq in eq_dict.items():
         print(f"{derivatives[eq_num]}, {key}: "
-              f"{len(eq.expand().args)} terms")
+              f"{len(eq.args)} terms")
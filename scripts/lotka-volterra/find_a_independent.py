@@ -1,13 +1,15 @@
 """Calculate generators independent of parameter a."""
 
-from math import prod
+import sys
 
-from sympy import symbols, Function, poly, Derivative, pdsolve, Wild, Eq
+from sympy import (symbols, Function, Mul, Poly, pdsolve, preorder_traversal,
+                   Eq, S)
 from sympy.core.function import AppliedUndef
 from sympy.solvers.solveset import linsolve
 
-from symmetries import JetSpace, generator_on, get_lin_symmetry_cond
-from symmetries.utils import derivatives_sort_key
+from symmetries import (JetSpace, generator_on, get_lin_symmetry_cond,
+                        get_lin_symmetry_cond_delta)
+from symmetries.utils import collect_function_atoms, derivatives_sort_key
 from printutils import CustomLatexPrinter
 
 
@@ -30,6 +32,10 @@ eta2 = Function("\\eta^2")(t, *states)
 # Printing tools
 latex = CustomLatexPrinter({"ln_notation": True})
 
+# The LaTeX dumps of the determining equations exist for the report and
+# can be silenced when re-running for timing
+VERBOSE = "--quiet" not in sys.argv
+
 # Solve the symmetry conditions
 
 sym_conds = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
@@ -38,18 +44,23 @@ sym_conds = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
 param_ind_det_eq1_dict = sym_conds[0].expand().collect(a, evaluate=False)
 param_ind_det_eq2_dict = sym_conds[1].expand().collect(a, evaluate=False)
 
-print("Original parameter independence determining equations:")
-print(latex.doprint(param_ind_det_eq1_dict[1].collect((xi, eta1, eta2))))
-print(latex.doprint(param_ind_det_eq1_dict[a].collect((xi, eta1, eta2))))
-print(latex.doprint(param_ind_det_eq1_dict[a**2].collect((xi, eta1, eta2))))
-print(latex.doprint(param_ind_det_eq2_dict[1].collect((xi, eta1, eta2))))
-print(latex.doprint(param_ind_det_eq2_dict[a].collect((xi, eta1, eta2))))
+if VERBOSE:
+    print("Original parameter independence determining equations:")
+    for key in (1, a, a**2):
+        if key in param_ind_det_eq1_dict:
+            print(latex.doprint(
+                param_ind_det_eq1_dict[key].collect((xi, eta1, eta2))))
+    for key in (1, a):
+        if key in param_ind_det_eq2_dict:
+            print(latex.doprint(
+                param_ind_det_eq2_dict[key].collect((xi, eta1, eta2))))
 
 xi = Function("\\xi")(t, u2)
 eta2 = Function("\\eta^2")(t, u2)
 
-sym_conds = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
-                                  jet_space, derivative_hints=(u1t, u2t))
+generator = Generator(xi, (eta1, eta2))
+sym_conds = get_lin_symmetry_cond(diff_eqs, generator, jet_space,
+                                  derivative_hints=(u1t, u2t))
 
 param_ind_det_eq2_dict = sym_conds[1].expand().collect(a, evaluate=False)
 eq_2_1_dict = param_ind_det_eq2_dict[1].collect(eta1, evaluate=False)
@@ -61,19 +72,31 @@ print("dPdt, 1 can be written as:")
 print(latex.doprint(Eq(old_eta1, eta1)))
 
 # The second symmetry condition is \equiv 0, so only first is dealt with
-sym_cond = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
-                                 jet_space, derivative_hints=(u1t, u2t))[0]
-function_monoids = list(sym_cond.expand().atoms(AppliedUndef))
-function_monoids += sorted(sym_cond.expand().atoms(Derivative),
+# The symmetry condition is linear in the generator, so each round
+# only prolongs the difference against the previous generator
+new_generator = Generator(xi, (eta1, eta2))
+sym_conds = get_lin_symmetry_cond_delta(diff_eqs, sym_conds, generator,
+                                        new_generator, jet_space,
+                                        derivative_hints=(u1t, u2t))
+generator = new_generator
+sym_cond = sym_conds[0]
+expanded_sym_cond = sym_cond.expand()
+function_atoms, derivative_atoms = \
+    collect_function_atoms(expanded_sym_cond)
+function_monoids = list(function_atoms)
+function_monoids += sorted(derivative_atoms,
                            key=derivatives_sort_key([xi, eta2], [t, u2]))
 
-a_u1_separated_equations = poly(sym_cond.expand(), (a, u1)).as_dict()
+a_u1_separated_equations = Poly(expanded_sym_cond, a, u1,
+                                expand=False).as_dict()
 
-print("dNdt eq. a-N-separation:")
-for key, eq in a_u1_separated_equations.items():
-    key_prod = prod(expr**n for expr, n in zip((a, u1), key))
-    print(f"{latex.doprint(key_prod)} & : & "
-          f"{latex.doprint(eq.expand().collect(function_monoids))}")
+if VERBOSE:
+    print("dNdt eq. a-N-separation:")
+    for key, eq in a_u1_separated_equations.items():
+        key_prod = Mul(*(expr**n
+                         for expr, n in zip((a, u1), key) if n))
+        print(f"{latex.doprint(key_prod)} & : & "
+              f"{latex.doprint(eq.expand().collect(function_monoids))}")
 
 algebraic_sols = linsolve(list(a_u1_separated_equations.values()),
                           function_monoids)
@@ -86,21 +109,31 @@ print(latex.doprint(Eq(xi.diff(u2), algebraic_sols_dict[xi.diff(u2)])))
 c1 = symbols("c_1", real=True)
 old_xi = xi
 xi = c1
-eta1 = eta1.replace(old_xi, xi).doit()
-
-sym_cond = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
-                                 jet_space, derivative_hints=(u1t, u2t))[0]
-function_monoids = list(sym_cond.expand().atoms(AppliedUndef))
-function_monoids += sorted(sym_cond.expand().atoms(Derivative),
+eta1 = eta1.xreplace({old_xi: xi}).doit()
+
+new_generator = Generator(xi, (eta1, eta2))
+sym_conds = get_lin_symmetry_cond_delta(diff_eqs, sym_conds, generator,
+                                        new_generator, jet_space,
+                                        derivative_hints=(u1t, u2t))
+generator = new_generator
+sym_cond = sym_conds[0]
+expanded_sym_cond = sym_cond.expand()
+function_atoms, derivative_atoms = \
+    collect_function_atoms(expanded_sym_cond)
+function_monoids = list(function_atoms)
+function_monoids += sorted(derivative_atoms,
                            key=derivatives_sort_key([xi, eta2], [t, u2]))
 
-a_u1_separated_equations = poly(sym_cond.expand(), (a, u1)).as_dict()
+a_u1_separated_equations = Poly(expanded_sym_cond, a, u1,
+                                expand=False).as_dict()
 
-print("Simplification gives the dNdt eq. a-N-separation:")
-for key, eq in a_u1_separated_equations.items():
-    key_prod = prod(expr**n for expr, n in zip((a, u1), key))
-    print(f"{latex.doprint(key_prod)} & : & "
-          f"{latex.doprint(eq.expand().collect(function_monoids))}")
+if VERBOSE:
+    print("Simplification gives the dNdt eq. a-N-separation:")
+    for key, eq in a_u1_separated_equations.items():
+        key_prod = Mul(*(expr**n
+                         for expr, n in zip((a, u1), key) if n))
+        print(f"{latex.doprint(key_prod)} & : & "
+              f"{latex.doprint(eq.expand().collect(function_monoids))}")
 
 eta2_solution = pdsolve(a_u1_separated_equations[(1, 0)])
 
@@ -108,26 +141,48 @@ print("With solution:")
 print(latex.doprint(eta2_solution))
 old_eta2 = eta2
 eta2 = eta2_solution.rhs
-eta1 = eta1.replace(old_eta2, eta2).doit()
-
-sym_cond = get_lin_symmetry_cond(diff_eqs, Generator(xi, (eta1, eta2)),
-                                 jet_space, derivative_hints=(u1t, u2t))[0]
-function_monoids = list(sym_cond.expand().atoms(AppliedUndef))
-function_monoids += sorted(sym_cond.expand().atoms(Derivative),
+eta1 = eta1.xreplace({old_eta2: eta2}).doit()
+
+new_generator = Generator(xi, (eta1, eta2))
+sym_conds = get_lin_symmetry_cond_delta(diff_eqs, sym_conds, generator,
+                                        new_generator, jet_space,
+                                        derivative_hints=(u1t, u2t))
+generator = new_generator
+sym_cond = sym_conds[0]
+expanded_sym_cond = sym_cond.expand()
+function_atoms, derivative_atoms = \
+    collect_function_atoms(expanded_sym_cond)
+function_monoids = list(function_atoms)
+function_monoids += sorted(derivative_atoms,
                            key=derivatives_sort_key())
 
-a_u1_separated_equations = poly(sym_cond.expand(), (a, u1)).as_dict()
+a_u1_separated_equations = Poly(expanded_sym_cond, a, u1,
+                                expand=False).as_dict()
 
-print("Further simplified dNdt eq. a-N-separation:")
-for key, eq in a_u1_separated_equations.items():
-    key_prod = prod(expr**n for expr, n in zip((a, u1), key))
-    print(f"{latex.doprint(key_prod)} & : & "
-          f"{latex.doprint(eq.expand().collect(function_monoids))}")
+if VERBOSE:
+    print("Further simplified dNdt eq. a-N-separation:")
+    for key, eq in a_u1_separated_equations.items():
+        key_prod = Mul(*(expr**n
+                         for expr, n in zip((a, u1), key) if n))
+        print(f"{latex.doprint(key_prod)} & : & "
+              f"{latex.doprint(eq.expand().collect(function_monoids))}")
 
 relevant_eq = a_u1_separated_equations[(0, 1)]
-arbitrary_func_name = list(relevant_eq.atoms(AppliedUndef))[0].name
-eta2 = eta2.replace(Function(arbitrary_func_name)(Wild("x")), 0)
-eta1 = eta1.replace(Function(arbitrary_func_name)(Wild("x")), 0).doit()
+# Only the name is needed, so the search stops at the first applied
+# undefined function instead of collecting all of them
+arbitrary_func_name = next(node.name
+                           for node in preorder_traversal(relevant_eq)
+                           if isinstance(node, AppliedUndef))
+# The applied instances of the arbitrary function are found directly
+# and zeroed with xreplace, avoiding the Wild pattern matcher
+arbitrary_func_zeros = {node: S.Zero
+                        for expr in (eta1, eta2)
+                        for node in preorder_traversal(expr)
+                        if isinstance(node, AppliedUndef)
+                        and node.func.__name__ == arbitrary_func_name}
+
+eta2 = eta2.xreplace(arbitrary_func_zeros)
+eta1 = eta1.xreplace(arbitrary_func_zeros).doit()
 
 print("Final result:")
 print(Generator(xi, (eta1, eta2)))
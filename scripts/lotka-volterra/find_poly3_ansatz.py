@@ -1,7 +1,12 @@
 """Find symmetries of the Lotka-Volterra model with a 3:rd degree
 polynomial ansatz.
 """
-from sympy import symbols, poly, linsolve, Function, Eq
+import os
+import sys
+from multiprocessing import get_context
+
+from sympy import symbols, poly, Add, Function, Eq, EX, Poly
+from sympy.polys.matrices import DomainMatrix
 
 from symmetries import (JetSpace, get_lin_symmetry_cond, Generator,
                         decompose_generator)
@@ -42,7 +47,7 @@ for i, eta in enumerate(inf_generator.etas, start=1):
     print_eta = poly(eta, ansatz_consts + [t] + list(states))
     print(latex.doprint(Eq(Function(f"\\eta^{i}")(t, *states), print_eta)))
 
-first_derivatives = (fibers[(1,)] for _, fibers in jet_space.fibers.items())
+first_derivatives = jet_space.first_derivatives
 lin_symmetry_cond = get_lin_symmetry_cond(diff_functions, inf_generator,
                                           jet_space,
                                           derivative_hints=first_derivatives)
@@ -50,22 +55,83 @@ lin_symmetry_cond = get_lin_symmetry_cond(diff_functions, inf_generator,
 num_eqs = len(lin_symmetry_cond)
 num_decomposed_eqs = 0
 
-print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-      end="", flush=True)
+# Progress is reported in percent-sized batches so that the terminal
+# writes do not tax short decomposition iterations
+progress_step = max(1, num_eqs // 100)
+
+sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed")
+sys.stdout.flush()
+
+
+# The generators and coefficient domain are fixed once, so the
+# per-equation conversions skip the domain inference that a bare poly
+# call repeats every time
+decomp_gens = (time,) + states
+
+
+def decompose_eq(eq):
+    """Decompose one symmetry condition equation into the coefficient
+    equations of its polynomial form.
+    """
+    return Poly(eq, decomp_gens, domain=EX).coeffs()
+
+
+# The equations decompose independently of each other, so spread them
+# over worker processes when more than one core is available. The fork
+# context is used since this script runs all its work at import and
+# must not be re-executed in the workers.
+num_workers = min(num_eqs, os.cpu_count() or 1)
+
+if num_workers > 1:
+    pool = get_context("fork").Pool(num_workers)
+    decomposed_iter = pool.imap(decompose_eq, lin_symmetry_cond)
+else:
+    pool = None
+    decomposed_iter = map(decompose_eq, lin_symmetry_cond)
 
 solvable_eqs = []
-for eq in lin_symmetry_cond:
-    solvable_eqs += poly(eq, (time,) + states).coeffs()
+for coeff_eqs in decomposed_iter:
+    solvable_eqs += coeff_eqs
 
     num_decomposed_eqs += 1
-    print(f"\r{num_decomposed_eqs}/{num_eqs} equations decomposed",
-          end="", flush=True)
+    if (num_decomposed_eqs % progress_step == 0
+            or num_decomposed_eqs == num_eqs):
+        sys.stdout.write(f"\r{num_decomposed_eqs}/{num_eqs} equations "
+                         "decomposed")
+        sys.stdout.flush()
+
+if pool:
+    pool.close()
+    pool.join()
 
 print(f"\nThe equation system has {str(len(solvable_eqs))} equations",
       flush=True)
 
-consts_sol = linsolve(solvable_eqs, ansatz_consts)
-solution = dict(zip(ansatz_consts, tuple(consts_sol)[0]))
+# The coefficient equations are homogeneous and linear in the ansatz
+# constants, and each equation only touches a handful of them. The
+# system is therefore solved by row reduction of a sparse coefficient
+# matrix instead of a dense linsolve call.
+sparse_rows = {}
+for row, eq in enumerate(solvable_eqs):
+    row_entries = {}
+    for monoid, coeff in poly(eq, ansatz_consts).terms():
+        col = next(index for index, exponent in enumerate(monoid) if exponent)
+        row_entries[col] = EX.from_sympy(coeff)
+    sparse_rows[row] = row_entries
+
+coeff_matrix = DomainMatrix(sparse_rows,
+                            (len(solvable_eqs), len(ansatz_consts)), EX)
+rref_matrix, pivot_cols = coeff_matrix.rref()
+rref_rows = dict(rref_matrix.to_sdm())
+
+# Free constants solve to themselves, while each pivot constant is read
+# off from its normalized row
+solution = dict(zip(ansatz_consts, ansatz_consts))
+for row, pivot_col in enumerate(pivot_cols):
+    solution[ansatz_consts[pivot_col]] = \
+        -Add(*(EX.to_sympy(entry) * ansatz_consts[col]
+               for col, entry in rref_rows.get(row, {}).items()
+               if col != pivot_col))
 xis = [xi.subs(solution) for xi in inf_generator.xis]
 etas = [eta.subs(solution) for eta in inf_generator.etas]
 
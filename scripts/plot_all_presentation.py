@@ -1,8 +1,15 @@
 """Script that plots everything to a desired location."""
+import os
 import os.path
 import argparse
 import importlib
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
 
+import matplotlib
+# The figures are only saved, never shown, and the Agg backend is safe
+# to use in forked worker processes
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 
@@ -25,18 +32,21 @@ OTHER_PLOT_FILES = [("generic.plot_triangle_symmetries",
                     ("generic.plot_jet_surface", {"plot_projection": False}),
                     ("generic.plot_tangent_field", {})]
 
-# Import the files containing the plot functions as modules
-solution_modules = []
-for src_file, kwargs in SOLUTION_PLOT_FILES:
-    solution_modules.append((importlib.import_module(src_file), kwargs))
+# Import the files containing the plot functions as modules. The
+# imports run on a thread pool, since the import machinery releases
+# the GIL while reading module files from disk.
+def _import_plot_modules(executor, plot_files):
+    modules = executor.map(importlib.import_module,
+                           (src_file for src_file, _ in plot_files))
 
-generator_modules = []
-for src_file, kwargs in GENERATOR_PLOT_FILES:
-    generator_modules.append((importlib.import_module(src_file), kwargs))
+    return [(module, kwargs)
+            for module, (_, kwargs) in zip(modules, plot_files)]
 
-other_modules = []
-for src_file, kwargs in OTHER_PLOT_FILES:
-    other_modules.append((importlib.import_module(src_file), kwargs))
+
+with ThreadPoolExecutor() as _executor:
+    solution_modules = _import_plot_modules(_executor, SOLUTION_PLOT_FILES)
+    generator_modules = _import_plot_modules(_executor, GENERATOR_PLOT_FILES)
+    other_modules = _import_plot_modules(_executor, OTHER_PLOT_FILES)
 
 # Add parser functionality
 parser = argparse.ArgumentParser(description="Generate all plots in the"
@@ -50,17 +60,32 @@ args = parser.parse_args()
 # Set up correct paths
 path = os.path.realpath(args.path)
 
-# Plot solution curves
-for module, kwargs in solution_modules:
-    module.plot(save_path=path, **kwargs)
-
-# Plot generator representatives
 generator_kwargs = {"limits": ((-2, 10), (0, 5)),
                     "transformation_kw_args": {"arrow_stroke_arguments": {"scaling": 2.8}}}
 
-for module, kwargs in generator_modules:
-    module.plot(save_path=path, **generator_kwargs, **kwargs)
+# Every figure is an independent job, so the plot calls are spread over
+# worker processes when more than one core is available. The fork
+# context keeps the already imported plot modules available in the
+# workers, which are passed the module names since modules cannot be
+# pickled.
+plot_jobs = ([(module.__name__, kwargs)
+              for module, kwargs in solution_modules]
+             + [(module.__name__, {**generator_kwargs, **kwargs})
+                for module, kwargs in generator_modules]
+             + [(module.__name__, kwargs)
+                for module, kwargs in other_modules])
+
+
+def _run_plot(job):
+    module_name, kwargs = job
+    importlib.import_module(module_name).plot(save_path=path, **kwargs)
+
+
+num_workers = min(len(plot_jobs), os.cpu_count() or 1)
 
-# Plot other plots
-for module, kwargs in other_modules:
-    module.plot(save_path=path, **kwargs)
+if num_workers > 1:
+    with get_context("fork").Pool(num_workers) as pool:
+        pool.map(_run_plot, plot_jobs)
+else:
+    for job in plot_jobs:
+        _run_plot(job)
@@ -24,12 +24,10 @@ class CustomLatexPrinter(LatexPrinter):
         if len(func_expr.args) == 1:
             tex = func_expr.func.name + "\'" * expr.derivative_count
         else:
-            tex = func_expr.func.name + "_{"
-
-            for derivative in expr.variables:
-                tex += str(derivative)
-
-            tex += "}"
+            # The subscript is joined in one pass instead of being
+            # concatenated one variable at a time
+            variables = "".join(str(variable) for variable in expr.variables)
+            tex = f"{func_expr.func.name}_{{{variables}}}"
 
         deriv_as_func_expr = Function(tex)(*func_expr.args)
 
@@ -73,13 +71,12 @@ class CustomLatexPrinter(LatexPrinter):
 
         terms = []
         for monom, coeff in poly.terms():
-            s_monom = ''
-            for i, exp in enumerate(monom):
-                if exp > 0:
-                    if exp == 1:
-                        s_monom += self._print(poly.gens[i])
-                    else:
-                        s_monom += self._print(pow(poly.gens[i], exp))
+            # Only the nonzero exponents contribute, and the factors
+            # are joined in one pass instead of being concatenated one
+            # at a time
+            s_monom = "".join(self._print(poly.gens[i]) if exp == 1
+                              else self._print(pow(poly.gens[i], exp))
+                              for i, exp in enumerate(monom) if exp > 0)
 
             if coeff.is_Add:
                 if s_monom:
@@ -2,7 +2,7 @@
 from .basis import decompose_generator
 from .generator import Generator, generator_on, get_prolongations, lie_bracket
 from .jetspace import JetSpace, total_derivative
-from .symcond import get_lin_symmetry_cond
+from .symcond import get_lin_symmetry_cond, get_lin_symmetry_cond_delta
 
 from . import utils
 from . import ansatz
@@ -1,10 +1,7 @@
 """Automatic generation of polynomial ansätze for infinitesimal
 generators.
 """
-from itertools import count
-import operator
-
-from sympy import Symbol
+from sympy import Add, Symbol
 from sympy.polys.monomials import itermonomials
 from sympy.polys.orderings import monomial_key
 
@@ -34,24 +31,27 @@ def create_poly_ansatz(jet_space, degree=1):
 
     monoids = sorted(itermonomials(independents + dependents, degree), key=key)
 
-    all_constants = []
-    constant_rows = count(1)
-
-    xis = []
-    for _, i in zip(independents, constant_rows):
-        constants = [Symbol(f"c_{{{i},{j}}}")
-                     for j in range(1, len(monoids) + 1)]
-        xis += [sum(map(operator.mul, monoids, constants))]
-
-        all_constants += constants
-
-    etas = []
-    for _, i in zip(dependents, constant_rows):
-        constants = [Symbol(f"c_{{{i},{j}}}")
-                     for j in range(1, len(monoids) + 1)]
-        etas += [sum(map(operator.mul, monoids, constants))]
-
-        all_constants += constants
+    num_monoids = len(monoids)
+    num_components = len(independents) + len(dependents)
+
+    # All arbitrary constants are created in one batch and sliced into
+    # rows, one row per generator component. The comma in the names
+    # rules out a single symbols call, since symbols splits its input
+    # on commas.
+    all_constants = [Symbol(f"c_{{{i},{j}}}")
+                     for i in range(1, num_components + 1)
+                     for j in range(1, num_monoids + 1)]
+
+    components = []
+    for row in range(num_components):
+        constants = all_constants[row * num_monoids:(row + 1) * num_monoids]
+        # The terms are summed in a single flat Add construction, since
+        # a running sum would recanonicalize the partial sums
+        components += [Add(*(constant * monoid
+                             for constant, monoid in zip(constants, monoids)))]
+
+    xis = components[:len(independents)]
+    etas = components[len(independents):]
 
     generator = Generator(xis, etas, jet_space.original_total_space)
 
@@ -24,19 +24,39 @@ def decompose_generator(generator, basis):
     :rtype: list[:class:`~generator.Generator`]
     """
 
-    xi_polys = [poly(xi, basis) for xi in generator.xis]
-    eta_polys = [poly(eta, basis) for eta in generator.etas]
+    num_bases = len(basis)
+    unit_key = (0,) * num_bases
+
+    # Each component is read into a dictionary of coefficients keyed by
+    # monomial exponent tuple in a single pass, instead of querying the
+    # polynomial once per basis element. Components that are identically
+    # zero or free of the basis never enter the polynomial machinery.
+    def component_coeffs(component):
+        if component == 0:
+            return {}
+
+        if not component.has(*basis):
+            return {unit_key: component}
+
+        return dict(poly(component, basis).terms())
+
+    xi_coeff_dicts = [component_coeffs(xi) for xi in generator.xis]
+    eta_coeff_dicts = [component_coeffs(eta) for eta in generator.etas]
+
+    base_keys = chain((unit_key,),
+                      ((0,) * i + (1,) + (0,) * (num_bases - i - 1)
+                       for i in range(num_bases)))
 
     generator_basis = []
 
-    for base in chain((1,), basis):
+    for base_key in base_keys:
         nonzero_generator = False
 
         base_xis = []
         base_etas = []
 
-        for xi_poly in xi_polys:
-            coeff = xi_poly.coeff_monomial(base)
+        for xi_coeffs in xi_coeff_dicts:
+            coeff = xi_coeffs.get(base_key, 0)
 
             if coeff:
                 nonzero_generator = True
@@ -44,8 +64,8 @@ def decompose_generator(generator, basis):
             else:
                 base_xis += [0]
 
-        for eta_poly in eta_polys:
-            coeff = eta_poly.coeff_monomial(base)
+        for eta_coeffs in eta_coeff_dicts:
+            coeff = eta_coeffs.get(base_key, 0)
 
             if coeff:
                 nonzero_generator = True
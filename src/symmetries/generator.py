@@ -1,8 +1,9 @@
 """Implementation of infinitesimal generators for sympy."""
 import operator
 from itertools import chain
+from weakref import WeakKeyDictionary
 
-from sympy import sympify
+from sympy import Add, sympify
 
 from .jetspace import JetSpace, total_derivative
 from .utils import iter_wrapper, zip_strict
@@ -31,9 +32,21 @@ class Generator:
         self.total_space = (list(iter_wrapper(total_space[0])),
                             list(iter_wrapper(total_space[1])))
 
+        # Prolongations are cached per jet space, since repeated
+        # applications of the same generator (eg. in Lie brackets or
+        # over a system of equations) reuse them. The weak keys let
+        # discarded jet spaces be collected. The cache relies on the
+        # components not being mutated after initialization.
+        self._prolongation_cache = WeakKeyDictionary()
+        self._default_jet_space = None
+
     def __call__(self, expr, jet_space=None):
         """Apply the generator on an expression on a jet space.
 
+        The prolongations of the generator are cached per jet space, so
+        repeated applications on the same jet space only prolong the
+        generator once.
+
         :param expr: The expression to apply the generator on.
         :type expr: :class:`sympy.Expr`
 
@@ -44,24 +57,42 @@ class Generator:
         :rtype: :class:`sympy.Expr`
         """
         if not jet_space:
-            jet_space = JetSpace(*self.total_space, 0)
+            if self._default_jet_space is None:
+                self._default_jet_space = JetSpace(*self.total_space, 0)
 
-        eta_prolongations = get_prolongations(self.xis, self.etas, jet_space)
+            jet_space = self._default_jet_space
+
+        try:
+            eta_prolongations = self._prolongation_cache[jet_space]
+        except KeyError:
+            eta_prolongations = get_prolongations(self.xis, self.etas,
+                                                  jet_space)
+            self._prolongation_cache[jet_space] = eta_prolongations
 
-        # Apply differential operation in each jet space coordinate
-        out_expr = 0
+        # Apply differential operation in each jet space coordinate.
+        # Differentiation in coordinates absent from the expression is
+        # skipped since those derivatives are known to be zero. The
+        # terms are summed in a single flat Add construction, since a
+        # running sum would recanonicalize the partial sums.
+        terms = []
+
+        expr_symbols = expr.free_symbols
 
         for base_coord, xi in zip(jet_space.base_space, self.xis):
-            out_expr += xi * expr.diff(base_coord)
+            if base_coord in expr_symbols:
+                terms.append(xi * expr.diff(base_coord))
 
         for dependent in jet_space.fibers:
-            for multiindex in jet_space.fibers[dependent]:
-                derivative = expr.diff(jet_space.fibers[dependent][multiindex])
+            for multiindex, fiber_coord in jet_space.fibers[dependent].items():
+                if fiber_coord not in expr_symbols:
+                    continue
+
+                derivative = expr.diff(fiber_coord)
                 eta_prolongation = eta_prolongations[dependent][multiindex]
 
-                out_expr += eta_prolongation * derivative
+                terms.append(eta_prolongation * derivative)
 
-        return out_expr
+        return Add(*terms)
 
     def __repr__(self):
 
@@ -281,11 +312,27 @@ def get_prolongations(xis, etas, jet_space):
     eta_prolongations = {}
     base_size = len(jet_space.base_space)
 
+    # The unit multiindices are assembled once, instead of once per
+    # multiindex in the prolongation loop
+    unit_indices = [(0,) * i + (1,) + (0,) * (base_size - i - 1)
+                    for i in range(base_size)]
+
+    # The total derivatives of the xis depend on neither the fiber nor
+    # the multiindex, so they are computed once for the whole
+    # prolongation
+    xi_total_derivs = [total_derivative(xi, base_coord, jet_space)
+                       for base_coord, xi
+                       in zip_strict(jet_space.base_space, xis)]
+
     for dependent, eta in zip_strict(jet_space.fibers, etas):
 
-        multiindex_iter = iter(jet_space.fibers[dependent])
+        dependent_fibers = jet_space.fibers[dependent]
+        multiindex_iter = iter(dependent_fibers)
 
-        eta_prolongations[dependent] = {(0,) * base_size: eta}
+        # The per-dependent dictionary is kept in a local so that the
+        # loops below touch one dictionary level instead of two
+        dependent_prolongations = {(0,) * base_size: eta}
+        eta_prolongations[dependent] = dependent_prolongations
         next(multiindex_iter)
 
         for multiindex in multiindex_iter:
@@ -293,9 +340,7 @@ def get_prolongations(xis, etas, jet_space):
             # number
             index_class = next(i for i, x in enumerate(multiindex) if x)
 
-            leading_deriv_index = ((0,) * index_class +
-                                   (1,) +
-                                   (0,) * (base_size - index_class - 1))
+            leading_deriv_index = unit_indices[index_class]
             leading_deriv_symbol = jet_space.base_space[index_class]
 
             # Calculate a lower order deivative from which the current
@@ -303,26 +348,29 @@ def get_prolongations(xis, etas, jet_space):
             prev_index = tuple(map(operator.sub, multiindex,
                                    leading_deriv_index))
 
-            prev_prolongation = eta_prolongations[dependent][prev_index]
+            prev_prolongation = dependent_prolongations[prev_index]
 
             # The D(eta_(n-1)) component of the prolongation formula
             eta_component = total_derivative(prev_prolongation,
                                              leading_deriv_symbol,
                                              jet_space)
-            eta_prolongations[dependent][multiindex] = eta_component
 
             # The omega_(n-1)*D(xi) components of the prolongation
-            # formula
-            for base_coord, xi in zip_strict(jet_space.base_space, xis):
-                base_index = jet_space.base_index(base_coord)
+            # formula. The base indices equal the precomputed unit
+            # multiindices, so no base space lookups are needed. The
+            # terms are accumulated locally and the prolongation is
+            # stored once per multiindex.
+            xi_terms = []
+            for unit_index, xi_total_deriv in zip_strict(unit_indices,
+                                                         xi_total_derivs):
                 derivative_index = tuple(map(operator.add, prev_index,
-                                             base_index))
+                                             unit_index))
 
-                deriv_coord = jet_space.fibers[dependent][derivative_index]
-                xi_term = deriv_coord * total_derivative(xi, base_coord,
-                                                         jet_space)
+                deriv_coord = dependent_fibers[derivative_index]
+                xi_terms.append(deriv_coord * xi_total_deriv)
 
-                eta_prolongations[dependent][multiindex] -=  xi_term
+            dependent_prolongations[multiindex] = (eta_component
+                                                   - Add(*xi_terms))
 
     return eta_prolongations
 
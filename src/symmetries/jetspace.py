@@ -3,7 +3,7 @@ from itertools import combinations_with_replacement
 import operator
 from copy import copy, deepcopy
 
-from sympy import Symbol
+from sympy import Symbol, S
 
 from .utils import iter_wrapper
 
@@ -50,16 +50,24 @@ class JetSpace:
         """Returns the derivative index for a coordinate in the base
         space.
 
+        The indices are cached on first use, so repeated lookups avoid
+        rescanning the base space.
+
         :param base_symbol: The symbol to find the base index of.
         :type base_symbol: :class:`sympy.Expr`
 
         :return: The multiindex of the desired symbol in the base space.
         :rtype: tuple[int, ...]
         """
-        base_num = self.base_space.index(base_symbol)
-        base_size = len(self.base_space)
+        try:
+            return self._base_indices[base_symbol]
+        except AttributeError:
+            base_size = len(self.base_space)
+            self._base_indices = {
+                symbol: (0,) * i + (1,) + (0,) * (base_size - i - 1)
+                for i, symbol in enumerate(self.base_space)}
 
-        return (0,) * base_num + (1,) + (0,) * (base_size - base_num - 1)
+            return self._base_indices[base_symbol]
 
 
     def extension(self, new_degree):
@@ -120,6 +128,19 @@ class JetSpace:
                     symbol_name = dependent.name + "_{" + deriv_string + "}"
                     self.fibers[dependent][deriv_index] = Symbol(symbol_name)
 
+    @property
+    def first_derivatives(self):
+        """The first order derivative coordinates of the fibers.
+
+        :return: The jet space coordinates of the first derivatives,
+            ordered firstly by fiber and secondly by base coordinate.
+        :rtype: tuple[:class:`sympy.Expr`]
+        """
+
+        return tuple(fiber[self.base_index(base_coord)]
+                     for fiber in self.fibers.values()
+                     for base_coord in self.base_space)
+
     @property
     def original_total_space(self):
         """The coordinates of the total space on which the jet space is
@@ -153,12 +174,20 @@ def total_derivative(jet_exp, coordinate, domain):
     """
     codomain = domain.extension(domain.degree + 1)
 
-    diff_jet_exp = jet_exp.diff(coordinate)
+    # Differentiation in coordinates absent from the expression is
+    # skipped since those derivatives are known to be zero
+    jet_exp_symbols = jet_exp.free_symbols
+
+    diff_jet_exp = jet_exp.diff(coordinate) if coordinate in jet_exp_symbols \
+        else S.Zero
 
     coord_index = domain.base_index(coordinate)
 
     for dependent, dependent_fibers in domain.fibers.items():
         for fiber_index, fiber_coord in dependent_fibers.items():
+            if fiber_coord not in jet_exp_symbols:
+                continue
+
             deriv_index = tuple(map(operator.add, fiber_index, coord_index))
             deriv_symbol = codomain.fibers[dependent][deriv_index]
             diff_jet_exp += deriv_symbol * jet_exp.diff(fiber_coord)
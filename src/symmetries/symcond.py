@@ -1,4 +1,6 @@
 """Testing of symmetry conditions."""
+from functools import lru_cache
+
 from sympy import linsolve
 
 from .utils import optional_iter, iter_wrapper, zip_strict
@@ -37,13 +39,76 @@ def get_lin_symmetry_cond(diff_eqs, generator, jet_space,
 
     eqs_halfway = (generator(eq, jet_space) for eq in diff_eqs)
 
-    submanifold_subs = find_submanifold_subs(diff_eqs, jet_space,
-                                             derivative_hints=derivative_hints)
+    # The submanifold substitutions depend on the differential
+    # equations but not on the generator, so they are cached to let
+    # repeated tests of different generators on the same equations
+    # reuse them
+    if derivative_hints is not None:
+        derivative_hints = tuple(iter_wrapper(derivative_hints))
+
+    submanifold_subs = _find_submanifold_subs_cached(tuple(diff_eqs),
+                                                     jet_space,
+                                                     derivative_hints)
     sym_cond = list(eq.subs(submanifold_subs) for eq in eqs_halfway)
 
     return sym_cond
 
 
+def get_lin_symmetry_cond_delta(diff_eqs, old_sym_conds, old_generator,
+                                new_generator, jet_space,
+                                derivative_hints=None):
+    """Update linearized symmetry conditions after a generator change.
+
+    The linearized symmetry condition is linear in the generator
+    components, so the conditions of the new generator equal the old
+    conditions plus the conditions of the component-wise difference of
+    the generators. When successive reductions only change a few
+    components, the difference prolongs cheaper than the full
+    generator.
+
+    :param diff_eqs: The differential equations expressed in jet space
+        notation.
+    :type diff_eqs: list[:class:`sympy.Expr`]
+
+    :param old_sym_conds: The symmetry conditions of the old generator.
+    :type old_sym_conds: list[:class:`sympy.Expr`]
+
+    :param old_generator: The generator the old conditions belong to.
+    :type old_generator: :class:`~generator.Generator`
+
+    :param new_generator: The generator to update the conditions to.
+    :type new_generator: :class:`~generator.Generator`
+
+    :param jet_space: The jet space on which the differential equations
+        exist.
+    :type jet_space: :class:`~jetspace.JetSpace`
+
+    :param derivative_hints: The highest order derivative(s) that the
+        differential equation(s) can be solved for.
+    :type derivative_hints: :class:`sympy.Expr` or
+        list[:class:`sympy.Expr`]
+
+    :return: The symmetry conditions of the new generator.
+    :rtype: list[:class:`sympy.Expr`]
+    """
+    delta_generator = new_generator - old_generator
+
+    delta_conds = get_lin_symmetry_cond(diff_eqs, delta_generator, jet_space,
+                                        derivative_hints=derivative_hints)
+
+    return [old_cond + delta_cond for old_cond, delta_cond
+            in zip_strict(iter_wrapper(old_sym_conds), delta_conds)]
+
+
+@lru_cache(maxsize=None)
+def _find_submanifold_subs_cached(diff_eqs, jet_space, derivative_hints):
+    """Cached wrapper of :func:`find_submanifold_subs` taking hashable
+    arguments.
+    """
+    return find_submanifold_subs(diff_eqs, jet_space,
+                                 derivative_hints=derivative_hints)
+
+
 @optional_iter
 def find_submanifold_subs(diff_eqs, jet_space, derivative_hints=None):
     """Find substitutions that can be used to evaluate a jet space
@@ -2,7 +2,8 @@
 from itertools import zip_longest
 from functools import wraps
 
-from sympy import symbols
+from sympy import symbols, preorder_traversal, Derivative
+from sympy.core.function import AppliedUndef
 
 
 def optional_iter(func):
@@ -64,6 +65,30 @@ def zip_strict(*iters):
         yield ziped
 
 
+def collect_function_atoms(expr):
+    """Collect the applied undefined functions and the derivatives of
+    an expression in a single traversal.
+
+    :param expr: The expression to collect atoms from.
+    :type expr: :class:`sympy.Expr`
+
+    :return: The set of applied undefined functions and the set of
+        derivatives in the expression.
+    :rtype: tuple[set[:class:`sympy.Expr`],
+        set[:class:`sympy.Derivative`]]
+    """
+    functions = set()
+    derivatives = set()
+
+    for node in preorder_traversal(expr):
+        if isinstance(node, Derivative):
+            derivatives.add(node)
+        elif isinstance(node, AppliedUndef):
+            functions.add(node)
+
+    return functions, derivatives
+
+
 def derivatives_sort_key(function_order=None, argument_order=None):
     """Ad hoc sort key for derivatives.
 
@@ -82,11 +107,26 @@ def derivatives_sort_key(function_order=None, argument_order=None):
     else:
         num_funcs = 1
 
+    # The function indices are looked up in a precomputed table instead
+    # of searching the function order per derivative, and computed keys
+    # are memoized so repeated sorts with the same key function only
+    # inspect each derivative once
+    function_indices = {}
+    for index, function in enumerate(function_order or []):
+        function_indices.setdefault(function, index)
+
+    key_cache = {}
+
     def _key(derivative):
         nonlocal function_order, argument_order
 
+        cached_key = key_cache.get(derivative)
+        if cached_key is not None:
+            return cached_key
+
         if not function_order:
             function_order = [derivative.expr]
+            function_indices.setdefault(derivative.expr, 0)
 
         if not argument_order:
             argument_order = list(derivative.expr_free_symbols)
@@ -102,15 +142,17 @@ def derivatives_sort_key(function_order=None, argument_order=None):
         comb_bound = num_der * num_dep ** num_der * num_der ** num_dep
         count_val = num_funcs * comb_bound
 
-        func_index = list(function_order).index(derivative.expr)
-        func_val = func_index * comb_bound
+        func_val = function_indices[derivative.expr] * comb_bound
 
         variable_dict = dict(derivative.variable_count)
         dep_val = 0
         for index, dep in enumerate(argument_order):
             dep_val += variable_dict.get(dep, 0) * num_der ** index
 
-        return count_val + func_val + dep_val
+        key = count_val + func_val + dep_val
+        key_cache[derivative] = key
+
+        return key
 
     return _key
 
@@ -130,19 +172,20 @@ def replace_consts(exprs, new_const_name):
     :rtype: tuple[:class:`sympy.Expr` or list[:class:`sympy.Expr`],
         list[:class:`sympy.Expr`]]
     """
-    exprs = iter_wrapper(exprs)
+    exprs = list(iter_wrapper(exprs))
 
-    new_consts = []
+    # Find the constants in one free-symbol pass and rename them with a
+    # single exact-tree xreplace, instead of one subs pass per constant
+    # probing for ever higher indices
+    old_consts = sorted(
+        {sym for expr in exprs for sym in expr.free_symbols
+         if sym.name.startswith("C") and sym.name[1:].isdigit()},
+        key=lambda sym: int(sym.name[1:]))
 
-    i = 1
-    while True:
-        old_const = symbols(f"C{i}")
-        new_const = symbols(f"{new_const_name}_{{{i}}}")
+    replacements = {old_const: symbols(f"{new_const_name}"
+                                       f"_{{{old_const.name[1:]}}}")
+                    for old_const in old_consts}
 
-        new_exprs = [expr.subs(old_const, new_const) for expr in exprs]
-        if new_exprs == exprs:
-            return exprs, new_consts
+    new_exprs = [expr.xreplace(replacements) for expr in exprs]
 
-        new_consts.append(new_const)
-        exprs = new_exprs
-        i += 1
+    return new_exprs, list(replacements.values())
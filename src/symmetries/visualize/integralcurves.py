@@ -19,13 +19,17 @@ def get_integral_curves(generator, start_points, parameters=None, boundry=None,
     if not parameters:
         parameters = {}
 
-    param_syms, param_vals = zip(*parameters.items())
-
-    vector_field = [lambdify(coords + list(param_syms), expr) for expr
-                    in generator.get_tangent_field(jet_space_order)]
+    # Bake the parameter values into the compiled components instead of
+    # passing them on every evaluation. The components are compiled as
+    # one function so that common subexpressions are shared across the
+    # whole vector field.
+    vector_field = lambdify(coords,
+                            [expr.xreplace(parameters) for expr
+                             in generator.get_tangent_field(jet_space_order)],
+                            cse=True)
 
     def diff_eq(_, y):
-        return np.array([func(*y, *param_vals) for func in vector_field])
+        return np.array(vector_field(*y))
 
     ds = max_len / 100
 
@@ -15,12 +15,20 @@ from ..utils import iter_wrapper
 def plot_transformation(generator, axs, diff_eq_rhs, init_val, tlim,
                         parameters=None, dt=0.1, ylim=None,
                         num_trans_points=10, trans_max_len=10,
-                        arrow_stroke_arguments=None, strict=False):
-    """Plot transformation defined by generator of an ODE on axis."""
+                        arrow_stroke_arguments=None, diff_eq_jac=None,
+                        base_curve=None, strict=False):
+    """Plot transformation defined by generator of an ODE on axis.
+
+    A pre-integrated solution curve through the initial value can be
+    passed as base_curve to share the integration between several
+    transformation plots of the same solution.
+    """
 
     # Plot the initial solution curve
     time_points, solut = plot_solution_curve(axs, diff_eq_rhs, init_val, tlim,
-                                             dt=dt, ylim=ylim, strict=strict)
+                                             dt=dt, ylim=ylim,
+                                             diff_eq_jac=diff_eq_jac,
+                                             curve=base_curve, strict=strict)
 
     if not ylim:
         ylim = (solut.min(axis=0), solut.max(axis=0))
@@ -42,25 +50,36 @@ def plot_transformation(generator, axs, diff_eq_rhs, init_val, tlim,
 
     time_points, solut = plot_solution_curve(axs, diff_eq_rhs,
                                              center_trans_end_point, tlim,
-                                             dt=dt, ylim=ylim, strict=strict)
+                                             dt=dt, ylim=ylim,
+                                             diff_eq_jac=diff_eq_jac,
+                                             strict=strict)
 
 
 def plot_solution_curve(axs, diff_eq_rhs, init_val, tlim, dt=0.1, ylim=None,
-                        strict=False):
-    """Plot the solution curve of an ODE."""
+                        diff_eq_jac=None, curve=None, strict=False):
+    """Plot the solution curve of an ODE.
+
+    If a pre-integrated curve is passed it is plotted as is instead of
+    integrating the ODE.
+    """
 
     # Process arguments
     axs = list(iter_wrapper(axs))
 
-    # Set up numerical integrator
-    integrator = ode(diff_eq_rhs).set_integrator('vode', method='adams')
-    integrator.set_initial_value(init_val[1:], init_val[0])
+    if curve:
+        time_points, solut = curve
+    else:
+        # Set up numerical integrator
+        integrator = ode(diff_eq_rhs, diff_eq_jac).set_integrator(
+            'vode', method='adams')
+        integrator.set_initial_value(init_val[1:], init_val[0])
 
-    tlim_diff = tlim[1] - tlim[0]
+        tlim_diff = tlim[1] - tlim[0]
 
-    time_points, solut = integrate_two_ways(integrator, dt, max_len=tlim_diff,
-                                            t_boundry=tlim, y_boundry=ylim,
-                                            strict=strict)
+        time_points, solut = integrate_two_ways(integrator, dt,
+                                                max_len=tlim_diff,
+                                                t_boundry=tlim, y_boundry=ylim,
+                                                strict=strict)
 
     for i, ax in enumerate(axs):
         ax.plot(time_points, solut[:,i])
@@ -31,6 +31,54 @@ def in_ranges(vec, ranges, strict=False):
 
 
 
+def _prepare_ranges(vec, ranges):
+    """Precompute the index and bound arrays needed to test a vector
+    against its ranges.
+
+    Doing this once per integration instead of once per step avoids
+    re-parsing the range specification in the integration loops.
+    Returns None if no component has a range.
+    """
+
+    vec = np.array(vec, ndmin=1)
+
+    if len(vec) > 1:
+        mask = [_range is not None for _range in ranges]
+
+        if not any(mask):
+            return None
+
+        indices = np.flatnonzero(mask)
+        bounds = np.array([_range for _range, m in zip(ranges, mask) if m],
+                          ndmin=2, dtype=float)
+    else:
+        if ranges is None:
+            return None
+
+        indices = np.array([0])
+        bounds = np.array(ranges, ndmin=2, dtype=float)
+
+    return indices, bounds[:, 0], bounds[:, 1]
+
+
+def _in_prepared_ranges(vec, prepared, strict=False):
+    """Test if elements in a vector are in ranges prepared by
+    :func:`~_prepare_ranges`.
+    """
+
+    if prepared is None:
+        return True
+
+    indices, lows, highs = prepared
+
+    vals = np.asarray(vec).ravel()[indices]
+
+    if strict:
+        return np.all(vals >= lows) and np.all(vals <= highs)
+    else:
+        return np.any(np.logical_and(vals >= lows, vals <= highs))
+
+
 def integrate_two_ways(integrator, dt, max_len, t_boundry=None,
                        y_boundry=None, strict=False):
     """Integrate an ODE in both directions, given a step size.
@@ -54,12 +102,15 @@ def integrate_two_ways(integrator, dt, max_len, t_boundry=None,
     init_t = integrator.t
     init_y = integrator.y
 
+    t_ranges = _prepare_ranges(init_t, t_boundry)
+    y_ranges = _prepare_ranges(init_y, y_boundry)
+
     curve_forward_t = []
     curve_forward_y = []
 
     while (integrator.t <= init_t + max_len
-           and in_ranges(integrator.t, t_boundry, strict=strict)
-           and in_ranges(integrator.y, y_boundry, strict=strict)):
+           and _in_prepared_ranges(integrator.t, t_ranges, strict=strict)
+           and _in_prepared_ranges(integrator.y, y_ranges, strict=strict)):
         integrator.integrate(integrator.t + dt)
 
         if integrator.successful():
@@ -74,8 +125,8 @@ def integrate_two_ways(integrator, dt, max_len, t_boundry=None,
     curve_backward_y = []
 
     while (integrator.t >= init_t - max_len
-           and in_ranges(integrator.t, t_boundry, strict=strict)
-           and in_ranges(integrator.y, y_boundry, strict=strict)):
+           and _in_prepared_ranges(integrator.t, t_ranges, strict=strict)
+           and _in_prepared_ranges(integrator.y, y_ranges, strict=strict)):
         integrator.integrate(integrator.t - dt)
 
         if integrator.successful():
@@ -113,12 +164,15 @@ def integrate_forward(integrator, dt, max_len, t_boundry=None, y_boundry=None,
     init_t = integrator.t
     init_y = integrator.y
 
+    t_ranges = _prepare_ranges(init_t, t_boundry)
+    y_ranges = _prepare_ranges(init_y, y_boundry)
+
     curve_forward_t = []
     curve_forward_y = []
 
     while (integrator.t <= init_t + max_len
-           and in_ranges(integrator.t, t_boundry, strict=strict)
-           and in_ranges(integrator.y, y_boundry, strict=strict)):
+           and _in_prepared_ranges(integrator.t, t_ranges, strict=strict)
+           and _in_prepared_ranges(integrator.y, y_ranges, strict=strict)):
         integrator.integrate(integrator.t + dt)
 
         if integrator.successful():
@@ -199,14 +253,14 @@ def get_spread(include_val, min_val, max_val, num_val):
     step_size = apr_step_size
 
     # Reduce step size in all dimensions with too low/high aproximative
-    # values
-    for i, min_diff in enumerate(min_val - apr_min_val):
-        if min_diff > 0:
-            step_size[i] -= min_diff / include_index
-
-    for i, max_diff in enumerate(apr_max_val - max_val):
-        if max_diff > 0:
-            step_size[i] -= max_diff / (num_val - 1 - include_index)
+    # values, as vectorized operations over the dimensions
+    if include_index > 0:
+        step_size -= (np.maximum(min_val - apr_min_val, 0)
+                      / include_index)
+
+    if include_index < num_val - 1:
+        step_size -= (np.maximum(apr_max_val - max_val, 0)
+                      / (num_val - 1 - include_index))
 
     final_min_val = include_val - include_index * step_size
     final_max_val = include_val + (num_val - 1 - include_index) * step_size